@@ -14,79 +14,212 @@ Single-file PyQt5 app. Features:
 
 Dependencies:
  pip install pyqt5 yt-dlp spotdl pytube youtube_dl pafy
+ Optional: pip install diskcache  (persists extracted metadata between runs)
 
 Run: python3 sci-fi_media_downloader.py
 """
 
 import sys
 import os
+import re
+import time
+import queue
+import selectors
 import threading
 import subprocess
 import shutil
+import functools
 from pathlib import Path
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
-# try imports for yt-dlp; we'll fail gracefully if missing
+# yt-dlp is imported on first download (it loads hundreds of extractors), so the
+# window shows up immediately; we'll fail gracefully if it's missing
+_ytdlp = None
+
+
+def _import_ytdlp():
+    global _ytdlp
+    if _ytdlp is None:
+        try:
+            import yt_dlp
+        except Exception:
+            return None
+        _ytdlp = yt_dlp
+    return _ytdlp
+
+# optional persistent cache for extracted metadata; falls back to a per-process dict
 try:
-    import yt_dlp as ytdlp
+    import diskcache
 except Exception:
-    ytdlp = None
+    diskcache = None
 
 # The app will use the spotdl CLI (assumes 'spotdl' is on PATH)
 
+# spotdl progress looks like "[ 23%]"; matched against raw output bytes
+_PCT_RE = re.compile(rb'\[\s*(\d+)%\]')
+
+# yt-dlp info dicts keyed by normalized URL -> (timestamp, info).
+# Format URLs handed out by YouTube expire after a few hours, so entries are short-lived.
+_INFO_TTL = 3600
+_info_cache = diskcache.Cache('.nebula_cache') if diskcache is not None else {}
+
+
+@functools.lru_cache(maxsize=8)
+def _which(name):
+    # resolving an executable walks every PATH entry (and PATHEXT on Windows); do it once per name
+    return shutil.which(name)
+
+
+def _normalize_url(url):
+    return url.strip().rstrip('/')
+
+
+def _get_cached_info(url):
+    entry = _info_cache.get(_normalize_url(url))
+    if entry and time.time() - entry[0] < _INFO_TTL:
+        return entry[1]
+    return None
+
+
+def _set_cached_info(url, info):
+    _info_cache[_normalize_url(url)] = (time.time(), info)
+
 
 class WorkerSignals(QtCore.QObject):
-    progress = QtCore.pyqtSignal(int)            # percent 0-100
-    log = QtCore.pyqtSignal(str)                 # log lines
+    # one queued signal per update instead of separate progress/log emissions:
+    # (percent 0-100 or None, log lines or None)
+    update = QtCore.pyqtSignal(object)
     finished = QtCore.pyqtSignal()
     error = QtCore.pyqtSignal(str)
 
 
 class DownloadWorker(QtCore.QRunnable):
-    def __init__(self, mode, url, outdir, audio_only, format_choice):
+    def __init__(self, mode, url, outdir, audio_only, format_choice, threadpool=None, parent=None, index=0):
         super().__init__()
         self.mode = mode  # 'youtube' or 'spotify'
         self.url = url
         self.outdir = outdir
         self.audio_only = audio_only
         self.format_choice = format_choice
-        self.signals = WorkerSignals()
+        # playlist items are fanned out to child workers on the same pool;
+        # children report log/progress through their parent's signals
+        self._threadpool = threadpool
+        self._parent = parent
+        self._index = index
+        self._children = []
+        self._child_pct = []
+        self._child_lock = threading.Lock()
+        self._done = threading.Event()
+        self.signals = parent.signals if parent is not None else WorkerSignals()
         self._is_cancelled = False
+        # progress hook throttling: at most ~10 emissions/s, log lines sent in batches
+        self._last_emit = 0.0
+        self._last_pct = -1
+        self._last_flush = 0.0
+        self._log_buf = []
 
     def cancel(self):
         self._is_cancelled = True
+        for child in self._children:
+            child.cancel()
+
+    def _cancelled(self):
+        # a playlist item also stops when its parent was cancelled, even before cancel() reached it
+        return self._is_cancelled or (self._parent is not None and self._parent._is_cancelled)
 
     def run(self):
         try:
+            if self._cancelled():
+                return
             if self.mode == 'youtube':
                 self._download_youtube()
             else:
                 self._download_spotify()
         except Exception as e:
-            self.signals.error.emit(str(e))
+            if self._parent is None:
+                self.signals.error.emit(str(e))
+            else:
+                self.signals.update.emit((None, f'ERROR: {self.url}: {e}'))
         finally:
-            self.signals.finished.emit()
+            self._flush_log()
+            self._done.set()
+            if self._parent is None:
+                self.signals.finished.emit()
+
+    def _emit_progress(self, pct, log=None):
+        if self._parent is not None:
+            self._parent._on_child_progress(self._index, pct)
+            if log is not None:
+                self.signals.update.emit((None, log))
+        else:
+            self.signals.update.emit((pct, log))
+
+    def _take_log(self):
+        text = '\n'.join(self._log_buf) if self._log_buf else None
+        self._log_buf = []
+        self._last_flush = time.monotonic()
+        return text
+
+    def _flush_log(self):
+        text = self._take_log()
+        if text is not None:
+            self.signals.update.emit((None, text))
+
+    def _on_child_progress(self, index, pct):
+        # overall playlist progress is the mean of the per-item percentages
+        with self._child_lock:
+            self._child_pct[index] = pct
+            overall = sum(self._child_pct) // len(self._child_pct)
+        self.signals.update.emit((overall, None))
 
     # ----------------- YouTube via yt-dlp -----------------
     def _ydl_progress_hook(self, d):
-        if self._is_cancelled:
+        if self._cancelled():
             return
         status = d.get('status')
         if status == 'downloading':
             total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
             downloaded = d.get('downloaded_bytes') or 0
             pct = int((downloaded / total) * 100) if total else 0
-            self.signals.progress.emit(pct)
+            now = time.monotonic()
+            # the hook fires on every chunk write; skip unless 100ms passed or the percent moved
+            if now - self._last_emit < 0.1 and pct == self._last_pct:
+                return
+            self._last_emit = now
+            self._last_pct = pct
             # build a short log message
             speed = d.get('speed')
             eta = d.get('eta')
-            self.signals.log.emit(f"Downloading: {d.get('filename','?')} - {pct}% - ETA: {eta}s - {speed} B/s")
+            self._log_buf.append(f"Downloading: {d.get('filename','?')} - {pct}% - ETA: {eta}s - {speed} B/s")
+            # progress and the batched log lines travel in the same emission
+            self._emit_progress(pct, self._take_log() if now - self._last_flush >= 0.5 else None)
         elif status == 'finished':
-            self.signals.log.emit('Download finished, finalizing...')
-            self.signals.progress.emit(100)
+            self._log_buf.append('Download finished, finalizing...')
+            self._emit_progress(100, self._take_log())
+
+    def _download_playlist(self, entries):
+        self.signals.update.emit((None, f'Playlist with {len(entries)} items, downloading in parallel...'))
+        self._child_pct = [0] * len(entries)
+        for i, entry in enumerate(entries):
+            if self._is_cancelled:
+                break
+            url = entry.get('webpage_url') or entry.get('url')
+            child = DownloadWorker(self.mode, url, self.outdir, self.audio_only, self.format_choice,
+                                   parent=self, index=i)
+            self._children.append(child)
+        started = []
+        for child in self._children:
+            if self._is_cancelled:
+                break
+            self._threadpool.start(child)
+            started.append(child)
+        # this worker holds a pool slot while waiting; the pool is sized so children still get threads
+        for child in started:
+            child._done.wait()
 
     def _download_youtube(self):
+        ytdlp = _import_ytdlp()
         if ytdlp is None:
             raise RuntimeError('yt-dlp Python module not found. Install with: pip install yt-dlp')
 
@@ -99,6 +232,8 @@ class DownloadWorker(QtCore.QRunnable):
             'ignoreerrors': True,
             'quiet': True,
             'no_warnings': True,
+            # keep yt-dlp's player JS / signature cache between runs
+            'cachedir': os.path.expanduser('~/.cache/yt-dlp'),
         }
 
         if self.audio_only:
@@ -115,53 +250,146 @@ class DownloadWorker(QtCore.QRunnable):
             # allow video
             ydl_opts.update({'format': 'bestvideo+bestaudio/best'})
 
-        self.signals.log.emit('Starting yt-dlp...')
+        self.signals.update.emit((None, 'Starting yt-dlp...'))
         with ytdlp.YoutubeDL(ydl_opts) as ydl:
-            # ydl.download accepts a list
-            ydl.download([self.url])
-        self.signals.log.emit('yt-dlp task complete')
+            info = _get_cached_info(self.url)
+            flat = None
+            if info is None and self._threadpool is not None:
+                # cheap flat pass: only enumerates entries, each item is resolved by its own worker
+                flat = ydl.extract_info(self.url, download=False, process=False)
+                if flat and flat.get('_type') in ('playlist', 'multi_video'):
+                    entries = [e for e in (flat.get('entries') or []) if e]
+                    if entries:
+                        self._download_playlist(entries)
+                        self.signals.update.emit((None, 'yt-dlp task complete'))
+                        return
+            if info is None:
+                if flat is not None:
+                    # not a playlist: finish resolving the flat result instead of extracting the page again
+                    info = ydl.process_ie_result(flat, download=False)
+                else:
+                    info = ydl.extract_info(self.url, download=False)
+                if info is None:
+                    raise RuntimeError(f'yt-dlp could not extract info for {self.url}')
+                info = ydl.sanitize_info(info)
+                _set_cached_info(self.url, info)
+            else:
+                self.signals.update.emit((None, 'Using cached metadata'))
+            # formats are re-selected from the info dict, so a cached entry works for any format choice
+            ydl.process_ie_result(info, download=True)
+        self.signals.update.emit((None, 'yt-dlp task complete'))
 
     # ----------------- Spotify via spotdl CLI -----------------
+    # both readers yield raw output chunks, and b'' every 100ms while the pipe is idle
+    @staticmethod
+    def _iter_pipe_select(proc):
+        fd = proc.stdout.fileno()
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while True:
+                if not sel.select(timeout=0.1):
+                    yield b''
+                    continue
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    return
+                yield chunk
+
+    @staticmethod
+    def _iter_pipe_threaded(proc):
+        # Windows: selectors can't poll pipes there, so a reader thread feeds a queue
+        fd = proc.stdout.fileno()
+        chunks = queue.Queue()
+
+        def pump():
+            while True:
+                chunk = os.read(fd, 65536)
+                chunks.put(chunk)
+                if not chunk:
+                    break
+
+        threading.Thread(target=pump, daemon=True).start()
+        while True:
+            try:
+                chunk = chunks.get(timeout=0.1)
+            except queue.Empty:
+                yield b''
+                continue
+            if not chunk:
+                return
+            yield chunk
+
     def _download_spotify(self):
         # Ensure spotdl CLI exists
-        if shutil.which('spotdl') is None:
+        spotdl_exe = _which('spotdl')
+        if spotdl_exe is None:
+            # don't remember the miss, so installing spotdl while the app is open works
+            _which.cache_clear()
             raise RuntimeError("spotdl CLI not found on PATH. Install with: pip install spotdl and ensure 'spotdl' is available.")
 
-        # Prepare CLI args
-        args = ['spotdl', self.url, '--output', os.path.join(self.outdir, '%(title)s.%(ext)s')]
+        # Prepare CLI args (absolute path, so the OS doesn't search PATH again)
+        args = [spotdl_exe, self.url, '--output', os.path.join(self.outdir, '%(title)s.%(ext)s')]
         if self.audio_only:
             # spotdl gives audio by default; we can force mp3
             args += ['--encode', 'mp3']
         # Run subprocess and stream lines
-        self.signals.log.emit('Starting spotdl (CLI). This may spawn ffmpeg/yt-dlp under the hood.')
+        self.signals.update.emit((None, 'Starting spotdl (CLI). This may spawn ffmpeg/yt-dlp under the hood.'))
 
-        proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+        if os.name == 'nt':
+            proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0,
+                                    creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+            chunks = self._iter_pipe_threaded(proc)
+        else:
+            proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
+            chunks = self._iter_pipe_select(proc)
+        tail = bytearray()
+        pct_carry = b''  # an unfinished "[ NN" at the end of the previous chunk
 
         try:
-            while True:
-                if self._is_cancelled:
+            # each chunk drains whatever the pipe has (up to 64 KiB); idle ticks let cancel act within ~100ms
+            for chunk in chunks:
+                if self._cancelled():
                     proc.terminate()
-                    self.signals.log.emit('Cancelled by user')
+                    self.signals.update.emit((None, 'Cancelled by user'))
                     break
-                line = proc.stdout.readline()
-                if not line:
-                    if proc.poll() is not None:
-                        break
+                if not chunk:
                     continue
-                self.signals.log.emit(line.strip())
-                # try to parse progress from line if possible (very heuristic)
-                if '%]' in line:
-                    try:
-                        # look for patterns like [ 23%]
-                        pct = int(line.split('%]')[0].split()[-1].replace('[', '').replace('%', '').strip())
-                        self.signals.progress.emit(max(0, min(100, pct)))
-                    except Exception:
-                        pass
+                # only the bytes up to the last newline are split; a partial line just extends the tail
+                log_lines = []
+                cut = chunk.rfind(b'\n')
+                if cut < 0:
+                    tail += chunk
+                else:
+                    tail += memoryview(chunk)[:cut]
+                    lines = tail.split(b'\n')
+                    tail = bytearray(memoryview(chunk)[cut + 1:])
+                    for line in lines:
+                        line = line.strip()
+                        # bare "[ 23%]" lines only feed the progress bar; never decode them
+                        if line and not _PCT_RE.fullmatch(line):
+                            log_lines.append(line.decode('utf-8', 'replace'))
+                # progress: cheap substring prefilter, then one anchored regex probe at the latest marker
+                pct = None
+                data = pct_carry + chunk if pct_carry else chunk
+                end = data.rfind(b'%]')
+                if end >= 0:
+                    start = data.rfind(b'[', 0, end)
+                    if start >= 0:
+                        m = _PCT_RE.match(data, start, end + 2)
+                        if m:
+                            pct = min(int(m.group(1)), 100)
+                # a marker split across two reads is completed by the next chunk
+                last = data.rfind(b'[')
+                pct_carry = data[last:] if last > end and len(data) - last <= 16 else b''
+                # at most one emission per chunk, carrying both the progress and the log lines
+                if pct is not None or log_lines:
+                    self.signals.update.emit((pct, '\n'.join(log_lines) if log_lines else None))
+            if tail.strip():
+                self.signals.update.emit((None, tail.strip().decode('utf-8', 'replace')))
         finally:
             rc = proc.wait()
             if rc == 0:
-                self.signals.log.emit('spotdl finished successfully')
-                self.signals.progress.emit(100)
+                self.signals.update.emit((100, 'spotdl finished successfully'))
             else:
                 self.signals.error.emit(f'spotdl exited with code {rc}')
 
@@ -174,6 +402,10 @@ class SciFiDownloader(QtWidgets.QMainWindow):
         self.setWindowIcon(QtGui.QIcon())
         self.resize(880, 600)
         self._threadpool = QtCore.QThreadPool()
+        # playlist items download concurrently; only ever grow the pool, never shrink it
+        wanted = min(8, (os.cpu_count() or 1) * 2)
+        if self._threadpool.maxThreadCount() < wanted:
+            self._threadpool.setMaxThreadCount(wanted)
 
         self._build_ui()
         self._apply_style()
@@ -232,8 +464,11 @@ class SciFiDownloader(QtWidgets.QMainWindow):
         self.btn_download = QtWidgets.QPushButton('Download')
         self.btn_cancel = QtWidgets.QPushButton('Cancel')
         self.btn_cancel.setEnabled(False)
+        self.btn_clear_cache = QtWidgets.QPushButton('Clear cache')
         self.btn_download.clicked.connect(self._on_download_clicked)
         self.btn_cancel.clicked.connect(self._on_cancel_clicked)
+        self.btn_clear_cache.clicked.connect(self._on_clear_cache_clicked)
+        btn_layout.addWidget(self.btn_clear_cache)
         btn_layout.addStretch()
         btn_layout.addWidget(self.btn_download)
         btn_layout.addWidget(self.btn_cancel)
@@ -244,6 +479,8 @@ class SciFiDownloader(QtWidgets.QMainWindow):
         self.log = QtWidgets.QTextEdit()
         self.log.setReadOnly(True)
         self.log.setLineWrapMode(QtWidgets.QTextEdit.NoWrap)
+        # bound memory for long sessions; oldest lines are dropped first
+        self.log.document().setMaximumBlockCount(2000)
         self.log.setFixedHeight(220)
 
         # Assemble
@@ -279,7 +516,20 @@ class SciFiDownloader(QtWidgets.QMainWindow):
             self.out_input.setText(d)
 
     def _append_log(self, text):
-        self.log.append(text)
+        # workers send batched lines; suspend repaints while appending a large batch
+        if text.count('\n') > 32:
+            self.log.setUpdatesEnabled(False)
+            self.log.append(text)
+            self.log.setUpdatesEnabled(True)
+        else:
+            self.log.append(text)
+
+    def _on_worker_update(self, update):
+        pct, text = update
+        if pct is not None:
+            self.progress.setValue(pct)
+        if text is not None:
+            self._append_log(text)
 
     def _on_download_clicked(self):
         url = self.url_input.text().strip()
@@ -304,9 +554,9 @@ class SciFiDownloader(QtWidgets.QMainWindow):
         self.btn_cancel.setEnabled(True)
 
         # create and start worker
-        worker = DownloadWorker(mode, url, outdir, audio_only, self.format_combo.currentText())
-        worker.signals.progress.connect(self.progress.setValue)
-        worker.signals.log.connect(self._append_log)
+        worker = DownloadWorker(mode, url, outdir, audio_only, self.format_combo.currentText(),
+                                threadpool=self._threadpool)
+        worker.signals.update.connect(self._on_worker_update)
         worker.signals.error.connect(lambda e: self._on_worker_error(e))
         worker.signals.finished.connect(self._on_worker_finished)
 
@@ -319,6 +569,10 @@ class SciFiDownloader(QtWidgets.QMainWindow):
             self._append_log('Cancellation requested...')
             self.btn_cancel.setEnabled(False)
 
+    def _on_clear_cache_clicked(self):
+        _info_cache.clear()
+        self._append_log('Metadata cache cleared.')
+
     def _on_worker_finished(self):
         self.btn_download.setEnabled(True)
         self.btn_cancel.setEnabled(False)
@@ -1,9 +1,11 @@
 import os
+import sys
+import atexit
 import tkinter as tk
 from tkinter import messagebox
 import subprocess
 import threading
-import time
+import queue
 import customtkinter as ctk
 
 # Set the appearance mode and default color theme for a sleek look
@@ -28,6 +30,15 @@ TARGET_LANGUAGES = {
     "Spanish": os.path.join(BASE_PATH, "spanish", "english_to_spanish.py"),
 }
 
+
+def find_existing_scripts():
+    return {name: path for name, path in TARGET_LANGUAGES.items() if os.path.exists(path)}
+
+
+# Checked once at startup (BASE_PATH may sit on a slow synced folder) and only
+# rescanned when the selected script is missing
+EXISTING_LANGUAGES = find_existing_scripts()
+
 class RealtimeControlPanel(ctk.CTk):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -41,6 +52,15 @@ class RealtimeControlPanel(ctk.CTk):
         except:
             self.font = ctk.CTkFont(family="Helvetica", size=20, weight="bold")
 
+        # one translator process per language; launching a language that is still running
+        # reuses it instead of starting another python + torch + transformers import.
+        # Different languages still load separate models (and CUDA contexts) in separate processes.
+        self._processes = {}
+        # child output is read on background threads and handed over through this queue
+        self.output_queue = queue.Queue()
+        self.partial_lines = {}
+        atexit.register(self.stop_processes)
+
         self.build_gui()
 
     def build_gui(self):
@@ -64,9 +84,9 @@ class RealtimeControlPanel(ctk.CTk):
         target_label.grid(row=1, column=0, padx=(10, 50), pady=10)
         
         self.target_var = ctk.StringVar()
-        target_dropdown = ctk.CTkComboBox(selection_frame, variable=self.target_var, values=list(TARGET_LANGUAGES.keys()), font=ctk.CTkFont(size=14), width=200)
-        target_dropdown.grid(row=1, column=1, padx=10, pady=10)
-        target_dropdown.set("English")
+        self.target_dropdown = ctk.CTkComboBox(selection_frame, variable=self.target_var, values=list(EXISTING_LANGUAGES.keys()), font=ctk.CTkFont(size=14), width=200)
+        self.target_dropdown.grid(row=1, column=1, padx=10, pady=10)
+        self.target_dropdown.set("English" if "English" in EXISTING_LANGUAGES else next(iter(EXISTING_LANGUAGES), ""))
 
         self.launch_btn = ctk.CTkButton(main_frame, text="Launch Translator", 
                                         font=ctk.CTkFont(size=16, weight="bold"),
@@ -83,44 +103,117 @@ class RealtimeControlPanel(ctk.CTk):
 
     def validate_and_launch(self):
         target_language = self.target_var.get()
-        script_path = TARGET_LANGUAGES.get(target_language)
+        script_path = EXISTING_LANGUAGES.get(target_language)
+        if script_path is None:
+            self.refresh_languages()
+            script_path = EXISTING_LANGUAGES.get(target_language)
 
-        if not script_path or not os.path.exists(script_path):
+        if not script_path:
+            script_path = TARGET_LANGUAGES.get(target_language)
             messagebox.showerror("Error", f"🚫 Script file not found for {target_language}.\n\nExpected path:\n{script_path}")
             self.status_label.configure(text="Validation Failed!")
             return
 
+        process = self._processes.get(target_language)
+        if process is not None and process.poll() is None:
+            self.status_label.configure(text=f"{target_language} translator is already running.")
+            return
+
         self.launch_btn.configure(state="disabled", text="Launching...")
         self.status_label.configure(text="Validating script path...")
-        threading.Thread(target=self.animate_and_launch, args=(script_path,), daemon=True).start()
+        self.animate_and_launch(target_language, script_path)
 
-    def animate_and_launch(self, script_path):
+    def animate_and_launch(self, language, script_path):
         try:
             # We use subprocess.Popen to get a reference to the process and its output stream.
-            process = subprocess.Popen(["python", script_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            process = subprocess.Popen([sys.executable, script_path], stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, bufsize=65536)
             self.status_label.configure(text="Translator script is running...")
+        except Exception as e:
+            self.status_label.configure(text=f"❌ Failed to launch: {e}")
+            messagebox.showerror("Launch Error", f"Failed to launch translator: {e}")
+            self.after(1500, self.reset_launcher)
+            return
 
-            # Real-time update loop
-            for line in process.stdout:
-                # Update the status label with each line of output
-                self.status_label.configure(text=line.strip())
-                self.update_idletasks() # Force GUI update
+        self._processes[language] = process
+        draining = bool(self.partial_lines)
+        self.partial_lines[process] = b""
+        threading.Thread(target=self.pump_output, args=(process, self.output_queue), daemon=True).start()
+        if not draining:
+            self.after(50, self.drain_output)
+        # other languages can be launched while this one is running
+        self.launch_btn.configure(state="normal", text="Launch Translator")
 
-            # Wait for the process to fully complete
-            process.wait()
+    @staticmethod
+    def pump_output(process, output_queue):
+        # Read the child's output as fast as it is produced so the pipe never fills up and
+        # stalls the child; None marks the end of the stream.
+        fd = process.stdout.fileno()
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            output_queue.put((process, chunk))
+        process.wait()
+        output_queue.put((process, None))
+
+    def drain_output(self):
+        # Runs on the Tk thread every 50ms: take everything queued, show only the last line.
+        chunks = {}
+        finished = []
+        try:
+            while True:
+                process, chunk = self.output_queue.get_nowait()
+                if chunk is None:
+                    finished.append(process)
+                else:
+                    chunks.setdefault(process, []).append(chunk)
+        except queue.Empty:
+            pass
+
+        last_line = None
+        for process, parts in chunks.items():
+            lines = (self.partial_lines.get(process, b"") + b"".join(parts)).split(b"\n")
+            self.partial_lines[process] = lines.pop()
+            lines = [line.decode(errors="replace").strip() for line in lines]
+            lines = [line for line in lines if line]
+            if lines:
+                last_line = lines[-1]
+        if last_line is not None:
+            self.status_label.configure(text=last_line)
+
+        for process in finished:
+            # output that did not end with a newline (often the error message) is still a line
+            final_line = self.partial_lines.pop(process, b"").decode(errors="replace").strip()
+            for language, child in list(self._processes.items()):
+                if child is process:
+                    del self._processes[language]
 
             # Final status update
             if process.returncode == 0:
                 self.status_label.configure(text="✅ Launch done!")
             else:
-                self.status_label.configure(text=f"❌ Script failed with code: {process.returncode}")
-
-        except Exception as e:
-            self.status_label.configure(text=f"❌ Failed to launch: {e}")
-            messagebox.showerror("Launch Error", f"Failed to launch translator: {e}")
-        
-        # Reset the GUI after a short delay
-        time.sleep(1.5)
+                message = f"❌ Script failed with code: {process.returncode}"
+                if final_line:
+                    message += f"\n{final_line}"
+                self.status_label.configure(text=message)
+            # Reset the GUI after a short delay
+            self.after(1500, self.reset_launcher)
+
+        if self.partial_lines:
+            self.after(50, self.drain_output)
+
+    def refresh_languages(self):
+        global EXISTING_LANGUAGES
+        EXISTING_LANGUAGES = find_existing_scripts()
+        self.target_dropdown.configure(values=list(EXISTING_LANGUAGES.keys()))
+
+    def stop_processes(self):
+        for process in self._processes.values():
+            if process.poll() is None:
+                process.terminate()
+
+    def reset_launcher(self):
         self.status_label.configure(text="")
         self.launch_btn.configure(state="normal", text="Launch Translator")
 
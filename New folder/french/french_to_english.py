@@ -97,9 +97,7 @@ class FrenchToEnglishGUI:
         filename = filedialog.askopenfilename(filetypes=[("Word Files", "*.docx")])
         if filename:
             doc = Document(filename)
-            text = ""
-            for para in doc.paragraphs:
-                text += para.text + "\n\n"
+            text = "\n\n".join(para.text for para in doc.paragraphs)
             self.input_text.delete("1.0", "end")
             self.input_text.insert("1.0", text.strip())
 
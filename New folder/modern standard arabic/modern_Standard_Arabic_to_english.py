@@ -4,30 +4,68 @@
 # First run must be online to download the model; subsequent runs use the local copy.
 
 import os
+
+# OpenMP reads these when torch is imported: one thread per core, pinned
+os.environ.setdefault("OMP_NUM_THREADS", str(os.cpu_count() or 1))
+os.environ.setdefault("KMP_AFFINITY", "granularity=fine,compact,1,0")
+
+import re
+import hashlib
+import queue
 import threading
 import traceback
 from datetime import datetime
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from transformers import MarianMTModel, MarianTokenizer
+from transformers import AutoTokenizer, MarianMTModel, MarianTokenizer
 import torch
 
+# use every core for the matmuls inside one generate() call; there is no
+# inter-op parallelism to exploit in a single decoding loop
+torch.set_num_threads(os.cpu_count() or 1)
+torch.set_num_interop_threads(1)
+
+# optional: Intel Extension for PyTorch (fused oneDNN kernels on Intel CPUs)
+try:
+    import intel_extension_for_pytorch as ipex
+except Exception:
+    ipex = None
+
 # optional: python-docx used for loading .docx files
 try:
     from docx import Document
 except Exception:
     Document = None
 
-# Ensure sentencepiece present (required by many Marian tokenizers)
+# optional: ONNX Runtime backend (via optimum) for faster CPU/GPU generation
+try:
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+except Exception:
+    ORTModelForSeq2SeqLM = None
+
+# whitespace after a sentence-ending mark (Latin, Arabic and CJK punctuation)
+SENTENCE_END = re.compile(r"(?<=[。！？.!؟?])\s+")
+
+# sentencepiece is required by the Marian tokenizer; a missing install is reported in the GUI
 try:
     import sentencepiece  # noqa: F401
+    HAS_SPM = True
 except Exception:
-    # Try to install -- if user has no internet this will fail; we handle later
+    HAS_SPM = False
+
+
+def cpu_supports_bf16():
+    """True when oneDNN has native bfloat16 kernels on this CPU (AVX512-BF16 / AMX)."""
     try:
-        os.system("pip install sentencepiece")
-        import sentencepiece  # noqa: F401
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
     except Exception:
-        pass
+        return False
+
+
+def int8_engine_available():
+    """True when PyTorch has an int8 GEMM backend for dynamic quantization on this CPU."""
+    engines = torch.backends.quantized.supported_engines
+    return any(engine in engines for engine in ("x86", "fbgemm", "qnnpack"))
 
 
 class ArabicToEnglishGUI:
@@ -46,9 +84,19 @@ class ArabicToEnglishGUI:
 
         self.tokenizer = None
         self.model = None
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.eager_forward = None  # original forward, kept in case the compiled one fails
+        self.batch_size = 8  # chunks per generate() call
+        self.greedy_max_tokens = 40  # shorter chunks use greedy decoding instead of 4 beams
+        # paragraph digest -> translation, so re-translating an edited document only
+        # runs the model on paragraphs that changed
+        self.translation_cache = {}
+        self.translation_cache_size = 4096
         self.is_translating = False
+        self.status_queue = queue.Queue()
 
         self.build_gui()
+        self._drain_status()
         self.load_model_async()
 
     def build_gui(self):
@@ -109,21 +157,41 @@ class ArabicToEnglishGUI:
         self.status_label.pack(fill=tk.X, side=tk.BOTTOM)
 
     def set_status(self, text):
-        def _update():
+        """Queue a status message; safe to call from any thread."""
+        self.status_queue.put_nowait(text)
+
+    def _drain_status(self):
+        """Show only the newest queued status message, every 50 ms."""
+        text = None
+        try:
+            while True:
+                text = self.status_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if text is not None:
             self.status_label.config(text=text)
-        self.root.after(0, _update)
+        self.root.after(50, self._drain_status)
 
     def load_model_async(self):
         """Load model in background thread. If local model folder empty, attempt download to cache then save."""
+        if not HAS_SPM:
+            self.set_status("Missing dependency: sentencepiece.")
+            messagebox.showerror("Missing package",
+                                 "sentencepiece is not installed. Install it with:\n\npip install sentencepiece")
+            return
         def worker():
             try:
+                self.translation_cache.clear()
                 self.set_status("Checking local model folder...")
                 # If folder has expected files, load from local
                 if self._local_model_present():
                     self.set_status("Loading model from local folder...")
-                    self.tokenizer = MarianTokenizer.from_pretrained(self.model_folder, use_fast=False)
-                    self.model = MarianMTModel.from_pretrained(self.model_folder)
-                    self.model.to("cpu")
+                    self.tokenizer = self._load_tokenizer(self.model_folder)
+                    if not self._load_onnx_model():
+                        # safetensors checkpoints are memory-mapped; low_cpu_mem_usage skips the
+                        # random-init copy of the weights that would be overwritten anyway
+                        self.model = MarianMTModel.from_pretrained(self.model_folder, low_cpu_mem_usage=True)
+                        self._prepare_model()
                     self.set_status("Model loaded from local folder. Ready.")
                     self.root.after(0, lambda: self.translate_btn.config(state=tk.NORMAL))
                     return
@@ -131,14 +199,16 @@ class ArabicToEnglishGUI:
                 # Else attempt to download (first run). Use cache_dir to save downloaded files.
                 self.set_status("Local model not found. Attempting to download (first run needs internet)...")
                 # This will download to transformers cache under cache_dir
-                self.tokenizer = MarianTokenizer.from_pretrained(self.model_name, use_fast=False, cache_dir=self.model_cache_dir)
-                self.model = MarianMTModel.from_pretrained(self.model_name, cache_dir=self.model_cache_dir)
-                self.model.to("cpu")
+                self.tokenizer = self._load_tokenizer(self.model_name, cache_dir=self.model_cache_dir)
+                self.model = MarianMTModel.from_pretrained(self.model_name, cache_dir=self.model_cache_dir,
+                                                           low_cpu_mem_usage=True)
 
                 # Save a local copy to our model_folder for easy offline loading next time
                 self.set_status("Saving model to local folder for offline use...")
                 self.tokenizer.save_pretrained(self.model_folder)
-                self.model.save_pretrained(self.model_folder)
+                self.model.save_pretrained(self.model_folder, safe_serialization=True)  # model.safetensors
+                if not self._load_onnx_model():
+                    self._prepare_model()
 
                 self.set_status("Model downloaded and saved locally. Ready.")
                 self.root.after(0, lambda: self.translate_btn.config(state=tk.NORMAL))
@@ -158,17 +228,92 @@ class ArabicToEnglishGUI:
                 # Keep translate button disabled
         threading.Thread(target=worker, daemon=True).start()
 
+    def _load_tokenizer(self, source, **kwargs):
+        """Prefer the Rust (fast) tokenizer when one exists for the model; fall back to MarianTokenizer."""
+        try:
+            return AutoTokenizer.from_pretrained(source, use_fast=True, **kwargs)
+        except Exception:
+            return MarianTokenizer.from_pretrained(source, **kwargs)
+
+    def _load_onnx_model(self):
+        """Use an ONNX Runtime copy of the local model if optimum is installed.
+
+        The export happens once into model_folder/onnx; returns False (keep PyTorch) on any failure.
+        """
+        if ORTModelForSeq2SeqLM is None:
+            return False
+        onnx_folder = os.path.join(self.model_folder, "onnx")
+        provider = "CUDAExecutionProvider" if self.device == "cuda" else "CPUExecutionProvider"
+        try:
+            if os.path.isfile(os.path.join(onnx_folder, "config.json")):
+                self.set_status("Loading ONNX Runtime model...")
+                model = ORTModelForSeq2SeqLM.from_pretrained(onnx_folder, provider=provider)
+            else:
+                self.set_status("Exporting model to ONNX (first run only)...")
+                model = ORTModelForSeq2SeqLM.from_pretrained(self.model_folder, export=True, provider=provider)
+                model.save_pretrained(onnx_folder)
+        except Exception:
+            print(traceback.format_exc())
+            return False
+        self.model = model
+        return True
+
+    def _prepare_model(self):
+        """Move the model to its device in the cheapest precision the hardware supports."""
+        if self.device == "cuda":
+            self.model.to(self.device, dtype=torch.float16)
+        elif ipex is not None:
+            dtype = torch.bfloat16 if cpu_supports_bf16() else torch.float32
+            self.model = ipex.optimize(self.model.to(self.device).eval(), dtype=dtype)
+        elif int8_engine_available():
+            # int8 weights for every Linear layer, activations quantized on the fly
+            self.model = torch.quantization.quantize_dynamic(self.model.to(self.device), {torch.nn.Linear},
+                                                             dtype=torch.qint8)
+        elif cpu_supports_bf16():
+            self.model.to(self.device, dtype=torch.bfloat16)
+        else:
+            self.model.to(self.device)  # no native bf16 on this CPU: stay in fp32
+        self.model.eval()
+
+        # generate() calls forward() once per decoding step, so that is what gets compiled;
+        # the warm-up runs the compilation here, before the Translate button is enabled
+        self.set_status("Compiling model (first translation warm-up)...")
+        # dynamic=True: the sequence length grows every decoding step and every batch has its
+        # own width, which would otherwise recompile until torch hits its cache limit
+        eager_forward = self.model.forward
+        try:
+            mode = "reduce-overhead" if self.device == "cuda" else None
+            self.model.forward = torch.compile(eager_forward, mode=mode, dynamic=True)
+            warmup = self.tokenizer(["ok"], return_tensors="pt").to(self.device)
+            with torch.inference_mode():
+                self.model.generate(**warmup, max_new_tokens=4)
+            self.eager_forward = eager_forward
+        except Exception:
+            self.model.forward = eager_forward  # older torch / unsupported platform: stay eager
+            self.eager_forward = None
+
+    def _generate(self, **kwargs):
+        """Run generate(); if the compiled forward fails on a new shape, go back to eager and retry."""
+        try:
+            with torch.inference_mode():
+                return self.model.generate(**kwargs)
+        except Exception:
+            if self.eager_forward is None:
+                raise
+            self.model.forward = self.eager_forward
+            self.eager_forward = None
+            with torch.inference_mode():
+                return self.model.generate(**kwargs)
+
     def _local_model_present(self):
         """Check whether the local model folder looks like a valid pretrained model folder."""
-        if not os.path.isdir(self.model_folder):
+        # a few targeted stats instead of listing the whole folder
+        def has(name):
+            return os.path.isfile(os.path.join(self.model_folder, name))
+
+        if not has("config.json"):
             return False
-        existing = set(os.listdir(self.model_folder))
-        # Basic checks
-        if "config.json" in existing and ("pytorch_model.bin" in existing or any(f.endswith(".safetensors") for f in existing)):
-            return True
-        if "config.json" in existing and ("spiece.model" in existing or "vocab.json" in existing):
-            return True
-        return False
+        return any(has(name) for name in ("model.safetensors", "pytorch_model.bin", "spiece.model", "vocab.json"))
 
     def load_docx(self):
         if Document is None:
@@ -179,7 +324,8 @@ class ArabicToEnglishGUI:
             return
         try:
             doc = Document(filename)
-            paragraphs = [p.text for p in doc.paragraphs if p.text.strip() != ""]
+            # Paragraph.text is rebuilt from the runs on every access, so read it once per paragraph
+            paragraphs = [t for t in (p.text for p in doc.paragraphs) if t and not t.isspace()]
             text = "\n\n".join(paragraphs)
             self.input_text.delete("1.0", tk.END)
             self.input_text.insert("1.0", text)
@@ -224,38 +370,76 @@ class ArabicToEnglishGUI:
                 self.is_translating = True
                 self.set_status("Translating...")
                 paragraphs = text.split("\n\n")
-                translated_paragraphs = []
                 max_input_len = getattr(self.model.config, "max_position_embeddings", 512)
                 # create safe chunk size leaving room for special tokens and generation length
                 chunk_size = max_input_len - 50 if max_input_len > 100 else 450
 
-                for para in paragraphs:
+                # Split the paragraphs that still need translating into sentences
+                keys = {}  # paragraph index -> cache key, for paragraphs not translated before
+                sentences = {}  # paragraph index -> its sentences
+                translated_paragraphs = [""] * len(paragraphs)
+                for idx, para in enumerate(paragraphs):
                     if not para.strip():
-                        translated_paragraphs.append("")
                         continue
-                    # Tokenize to IDs to chunk if too long
-                    input_ids = self.tokenizer.encode(para, add_special_tokens=True)
-                    if len(input_ids) <= chunk_size:
-                        # simple short paragraph
-                        inputs = torch.tensor([input_ids])
-                        with torch.no_grad():
-                            out = self.model.generate(inputs, max_new_tokens=256, num_beams=4, early_stopping=True)
-                        translated = self.tokenizer.decode(out[0], skip_special_tokens=True)
-                        translated_paragraphs.append(translated)
+                    key = hashlib.blake2b(para.encode("utf-8"), digest_size=16).digest()
+                    if key in self.translation_cache:
+                        translated_paragraphs[idx] = self.translation_cache[key]
+                        continue
+                    keys[idx] = key
+                    sentences[idx] = SENTENCE_END.split(para)
+
+                # Tokenize all sentences of the document in one tokenizer call, then pack
+                # them back into per-paragraph chunks
+                flat = [sentence for para_sentences in sentences.values() for sentence in para_sentences]
+                flat_ids = iter(self.tokenizer(flat, add_special_tokens=False)["input_ids"] if flat else [])
+                chunks = []  # (paragraph index, chunk token ids)
+                for idx, para_sentences in sentences.items():
+                    sentence_ids = [next(flat_ids) for _ in para_sentences]
+                    for chunk_ids in self._pack_sentences(sentence_ids, chunk_size):
+                        chunks.append((idx, chunk_ids))
+
+                # Translate the chunks in small batches: one generate() call per batch
+                # instead of one per chunk. Batches are formed over the chunks sorted by
+                # length so each one pads to a similar size, then results go back in order.
+                order = sorted(range(len(chunks)), key=lambda i: len(chunks[i][1]))
+                results = [None] * len(chunks)
+                # one flat host buffer reused by every batch (pinned on CUDA so the copy to the
+                # device can be asynchronous); each batch is a contiguous view over its start
+                pin = self.device == "cuda"
+                pad_id = self.tokenizer.pad_token_id
+                ids_buf = torch.empty(self.batch_size * chunk_size, dtype=torch.long, pin_memory=pin)
+                mask_buf = torch.empty(self.batch_size * chunk_size, dtype=torch.long, pin_memory=pin)
+                for b in range(0, len(order), self.batch_size):
+                    batch = order[b:b + self.batch_size]
+                    width = len(chunks[batch[-1]][1])
+                    input_ids = ids_buf[:len(batch) * width].view(len(batch), width).fill_(pad_id)
+                    attention_mask = mask_buf[:len(batch) * width].view(len(batch), width).zero_()
+                    for row, i in enumerate(batch):
+                        n = len(chunks[i][1])
+                        input_ids[row, :n].copy_(torch.as_tensor(chunks[i][1]))
+                        attention_mask[row, :n] = 1
+                    inputs = {"input_ids": input_ids.to(self.device, non_blocking=True),
+                              "attention_mask": attention_mask.to(self.device, non_blocking=True)}
+                    # short chunks (the batch is length-sorted, so its last one is the longest)
+                    # lose next to nothing with greedy decoding, at a quarter of the beam cost
+                    if len(chunks[batch[-1]][1]) < self.greedy_max_tokens:
+                        decode_args = {"num_beams": 1, "do_sample": False}
                     else:
-                        # chunk and translate piecewise
-                        parts = []
-                        start = 0
-                        while start < len(input_ids):
-                            chunk_ids = input_ids[start:start + chunk_size]
-                            inputs = torch.tensor([chunk_ids])
-                            with torch.no_grad():
-                                out = self.model.generate(inputs, max_new_tokens=256, num_beams=4, early_stopping=True)
-                            part = self.tokenizer.decode(out[0], skip_special_tokens=True)
-                            parts.append(part)
-                            start += chunk_size
-                        # join parts with space (best-effort)
-                        translated_paragraphs.append(" ".join(parts))
+                        decode_args = {"num_beams": 4, "early_stopping": True}
+                    out = self._generate(**inputs, max_new_tokens=256, use_cache=True, **decode_args)
+                    for i, part in zip(batch, self.tokenizer.batch_decode(out.cpu(), skip_special_tokens=True)):
+                        results[i] = part
+
+                parts = [[] for _ in paragraphs]
+                for (idx, _), part in zip(chunks, results):
+                    parts[idx].append(part)
+
+                # join parts with space (best-effort) and remember the new translations
+                for idx, key in keys.items():
+                    translated_paragraphs[idx] = " ".join(parts[idx])
+                    if len(self.translation_cache) >= self.translation_cache_size:
+                        self.translation_cache.pop(next(iter(self.translation_cache)))
+                    self.translation_cache[key] = translated_paragraphs[idx]
 
                 final = "\n\n".join(translated_paragraphs)
                 # show result in GUI
@@ -270,6 +454,29 @@ class ArabicToEnglishGUI:
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _pack_sentences(self, sentence_ids, chunk_size):
+        """Pack a paragraph's tokenized sentences into chunks of <= chunk_size tokens.
+
+        Only a single sentence longer than chunk_size is cut mid-sentence. Chunks are
+        translated independently (and batched together), so no decoder state is carried
+        from one chunk to the next: the cached cross-attention keys belong to one encoder input.
+        """
+        eos = self.tokenizer.eos_token_id
+        limit = chunk_size - 1  # room for </s>
+        chunks = []
+        current = []
+        for ids in sentence_ids:
+            if current and len(current) + len(ids) > limit:
+                chunks.append(current + [eos])
+                current = []
+            current.extend(ids)
+            while len(current) > limit:
+                chunks.append(current[:limit] + [eos])
+                current = current[limit:]
+        if current:
+            chunks.append(current + [eos])
+        return chunks
+
     def show_translation(self, text):
         self.output_text.config(state=tk.NORMAL)
         self.output_text.delete("1.0", tk.END)
@@ -1,9 +1,12 @@
 import os
+import sys
+import atexit
 import tkinter as tk
 from tkinter import messagebox
 import subprocess
 import threading
 import time
+from collections import deque
 import customtkinter as ctk
 
 # Set appearance for sleek look
@@ -40,6 +43,18 @@ class ReverseControlPanel(ctk.CTk):
         except:
             self.font = ctk.CTkFont(family="Helvetica", size=20, weight="bold")
 
+        # one translator process per language; choosing a language whose window is
+        # still open reuses it instead of paying for another torch/transformers start-up
+        self._processes = {}
+        atexit.register(self.stop_processes)
+
+        # written by the reader threads, shown by tick() on the Tk thread
+        self.latest_line = ""
+        self.shown_line = ""
+        self.shown_at = 0.0
+        self.exited = deque()  # (language, process) pairs whose script has finished
+        self.ticking = False
+
         self.build_gui()
 
     def build_gui(self):
@@ -92,34 +107,75 @@ class ReverseControlPanel(ctk.CTk):
             self.status_label.configure(text="Validation Failed!")
             return
 
+        process = self._processes.get(source_language)
+        if process is not None and process.poll() is None:
+            self.status_label.configure(text=f"{source_language} ➝ English translator is already running.")
+            return
+
         self.launch_btn.configure(state="disabled", text="Launching...")
         self.status_label.configure(text="Validating script path...")
-        threading.Thread(target=self.animate_and_launch, args=(script_path,), daemon=True).start()
-
-    def animate_and_launch(self, script_path):
         try:
-            process = subprocess.Popen(["python", script_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-            self.status_label.configure(text="Translator script is running...")
-
-            for line in process.stdout:
-                self.status_label.configure(text=line.strip())
-                self.update_idletasks()
+            # sys.executable: the same interpreter (and installed packages) as this panel
+            process = subprocess.Popen([sys.executable, script_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                       text=True, bufsize=1)  # line-buffered: each line is available as soon as it is printed
+        except Exception as e:
+            self.status_label.configure(text=f"❌ Failed to launch: {e}")
+            messagebox.showerror("Launch Error", f"Failed to launch translator: {e}")
+            self.after(1500, self.reset_launcher)
+            return
 
-            process.wait()
+        self._processes[source_language] = process
+        self.latest_line = "Translator script is running..."
+        threading.Thread(target=self.animate_and_launch, args=(source_language, process), daemon=True).start()
+        if not self.ticking:
+            self.ticking = True
+            self.after(33, self.tick)
+        # other languages can be launched while this one is running
+        self.launch_btn.configure(state="normal", text="Launch Translator")
 
+    def animate_and_launch(self, language, process):
+        # Reader thread: only records the newest line, the Tk thread picks it up in tick()
+        for line in process.stdout:
+            self.latest_line = line.strip()
+        process.wait()
+        self.exited.append((language, process))
+
+    def tick(self):
+        # Runs ~30 times a second; the label itself changes at most 10 times a second
+        # no matter how chatty the scripts are
+        line = self.latest_line
+        now = time.monotonic()
+        if line and line != self.shown_line and now - self.shown_at >= 0.1:
+            self.status_label.configure(text=line)
+            self.shown_line = line
+            self.shown_at = now
+
+        while self.exited:
+            language, process = self.exited.popleft()
+            if self._processes.get(language) is process:
+                del self._processes[language]
             if process.returncode == 0:
                 self.status_label.configure(text="✅ Launch done!")
             else:
                 self.status_label.configure(text=f"❌ Script failed with code: {process.returncode}")
+            # the final status wins over a line the throttle had not shown yet
+            self.shown_line = self.latest_line
+            self.after(1500, self.reset_launcher)
 
-        except Exception as e:
-            self.status_label.configure(text=f"❌ Failed to launch: {e}")
-            messagebox.showerror("Launch Error", f"Failed to launch translator: {e}")
-        
-        time.sleep(1.5)
+        if self._processes:
+            self.after(33, self.tick)
+        else:
+            self.ticking = False
+
+    def reset_launcher(self):
         self.status_label.configure(text="")
         self.launch_btn.configure(state="normal", text="Launch Translator")
 
+    def stop_processes(self):
+        for process in self._processes.values():
+            if process.poll() is None:
+                process.terminate()
+
 if __name__ == "__main__":
     app = ReverseControlPanel()
     app.mainloop()
@@ -9,6 +9,14 @@ from docx import Document
 # transformers imports are done inside loader function to gracefully handle fallback
 from transformers import MarianMTModel, MarianTokenizer, T5ForConditionalGeneration, T5Tokenizer
 
+
+def cpu_supports_bf16():
+    # oneDNN has native bfloat16 kernels on this CPU (AVX512-BF16 / AMX)
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except Exception:
+        return False
+
 class PTtoENTranslatorGUI:
     def __init__(self, root):
         self.root = root
@@ -24,6 +32,7 @@ class PTtoENTranslatorGUI:
         self.tokenizer = None
         self.model_type = None  # 'marian' or 't5'
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.eager_forward = None  # original forward, kept in case the compiled one fails
         self.is_translating = False
 
         self.build_gui()
@@ -91,18 +100,19 @@ class PTtoENTranslatorGUI:
                 self.update_status(f"Loading primary model: {self.primary_model_name} ...")
                 # try primary (Marian)
                 self.tokenizer = MarianTokenizer.from_pretrained(self.primary_model_name)
-                self.model = MarianMTModel.from_pretrained(self.primary_model_name)
-                self.model.to(self.device)
+                self.model = MarianMTModel.from_pretrained(self.primary_model_name, low_cpu_mem_usage=True)
                 self.model_type = "marian"
+                self.prepare_model()
                 self.root.after(0, self.on_model_loaded)
             except Exception as primary_err:
                 # fallback to T5
                 try:
                     self.update_status(f"Primary failed, loading fallback: {self.fallback_model_name} ...")
                     self.tokenizer = T5Tokenizer.from_pretrained(self.fallback_model_name)
-                    self.model = T5ForConditionalGeneration.from_pretrained(self.fallback_model_name)
-                    self.model.to(self.device)
+                    self.model = T5ForConditionalGeneration.from_pretrained(self.fallback_model_name,
+                                                                            low_cpu_mem_usage=True)
                     self.model_type = "t5"
+                    self.prepare_model()
                     self.root.after(0, self.on_model_loaded)
                 except Exception as fallback_err:
                     err_msg = f"Primary error: {primary_err}\n\nFallback error: {fallback_err}"
@@ -110,6 +120,49 @@ class PTtoENTranslatorGUI:
 
         threading.Thread(target=_load, daemon=True).start()
 
+    def prepare_model(self):
+        # half-precision weights: fp16 on GPU (bf16 for T5, which overflows in fp16),
+        # bf16 on CPUs with native support, fp32 otherwise
+        if self.device == "cuda":
+            if self.model_type == "t5":
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float32
+            else:
+                dtype = torch.float16
+        else:
+            dtype = torch.bfloat16 if cpu_supports_bf16() else torch.float32
+        self.model.to(self.device, dtype=dtype)
+        self.model.eval()
+
+        # generate() calls forward() once per decoding step, so that is what gets compiled;
+        # the warm-up runs the compilation here, before the Translate button is enabled
+        self.update_status("Compiling model (first translation warm-up)...")
+        # dynamic=True: the sequence length grows every decoding step and every paragraph has its
+        # own length, which would otherwise recompile until torch hits its cache limit
+        eager_forward = self.model.forward
+        try:
+            mode = "reduce-overhead" if self.device == "cuda" else None
+            self.model.forward = torch.compile(eager_forward, mode=mode, dynamic=True)
+            warmup = self.tokenizer(["ok"], return_tensors="pt").to(self.device)
+            with torch.inference_mode():
+                self.model.generate(**warmup, max_new_tokens=4)
+            self.eager_forward = eager_forward
+        except Exception:
+            self.model.forward = eager_forward  # older torch / unsupported platform: stay eager
+            self.eager_forward = None
+
+    def generate(self, **kwargs):
+        try:
+            with torch.inference_mode():
+                return self.model.generate(**kwargs)
+        except Exception:
+            if self.eager_forward is None:
+                raise
+            # a recompile for a new shape failed: fall back to eager and retry
+            self.model.forward = self.eager_forward
+            self.eager_forward = None
+            with torch.inference_mode():
+                return self.model.generate(**kwargs)
+
     def on_model_loaded(self):
         self.update_status(f"Model loaded ({self.model_type}) — ready.")
         self.translate_btn.config(state="normal")
@@ -143,7 +196,7 @@ class PTtoENTranslatorGUI:
                         inputs = self.tokenizer(para, return_tensors="pt", truncation=True, padding=True)
                         for k,v in inputs.items():
                             inputs[k] = v.to(self.device)
-                        gen = self.model.generate(**inputs, max_length=512)
+                        gen = self.generate(**inputs, max_length=512)
                         txt = self.tokenizer.decode(gen[0], skip_special_tokens=True)
                         out_paras.append(txt)
                     else:
@@ -153,7 +206,7 @@ class PTtoENTranslatorGUI:
                         inputs = self.tokenizer(text_in, return_tensors="pt", truncation=True, padding=True, max_length=512)
                         for k,v in inputs.items():
                             inputs[k] = v.to(self.device)
-                        gen = self.model.generate(**inputs, max_length=512)
+                        gen = self.generate(**inputs, max_length=512)
                         txt = self.tokenizer.decode(gen[0], skip_special_tokens=True)
                         out_paras.append(txt)
 
@@ -1,23 +1,93 @@
 import os
+
+# read by torch's CUDA caching allocator: don't split cached blocks above 128 MB, so a long
+# session doesn't fragment them (expandable_segments needs torch >= 2.1, requirements pin 2.0.1)
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "max_split_size_mb:128")
+
+import functools
 import threading
+import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from datetime import datetime
 
 import torch
-from transformers import MarianMTModel, MarianTokenizer, pipeline
+from transformers import MarianMTModel, MarianTokenizer
 from docx import Document
 
+# optional: CTranslate2 runs the converted model with int8 weights
+try:
+    import ctranslate2
+except ImportError:
+    ctranslate2 = None
+
 # ------------- Configuration -------------
 MODEL_NAME = "Helsinki-NLP/opus-mt-en-ru"   # actual EN -> RU OPUS-MT model
 MODEL_DIR = r"C:\Users\intel\models\opus-mt-en-ru"  # local cache directory
+BATCH_SIZE = 16  # paragraphs per generate() call
+BEAM_SIZE = 2
+MAX_NEW_TOKENS = 256  # hard cap on translated length, per paragraph
+CT2_DIR = MODEL_DIR + "_ct2"  # CTranslate2 copy, converted on first run
+INSERT_CHUNK = 256 * 1024  # characters per Text.insert() for very large documents
 
 # ------------- Globals -------------
-translator = None
-device_index = 0 if torch.cuda.is_available() else -1
-device_str = "cuda" if torch.cuda.is_available() else "cpu"
+model = None
+tokenizer = None
+ct2_translator = None
+eager_forward = None  # uncompiled model.forward while the compiled one is in place
+translation_cache = {}  # paragraph -> translation, kept across Translate clicks
+TRANSLATION_CACHE_SIZE = 4096
+device_str = None  # "cuda" or "cpu", set by _load via _get_device()
 
 # ------------- Model loading -------------
+@functools.cache
+def _get_device():
+    """Probe for CUDA once; called from the load thread so the window opens before CUDA initialises."""
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+@functools.cache
+def _load_tokenizer(model_dir):
+    """Tokenizer for model_dir; loaded from disk once per process."""
+    return MarianTokenizer.from_pretrained(model_dir)
+
+@functools.cache
+def _load_ckpt(model_dir):
+    """
+    Marian checkpoint for model_dir; loaded from disk once per process.
+    Asks for the fused scaled_dot_product_attention kernels, falling back to the
+    default attention on transformers/torch versions that do not offer them.
+    """
+    try:
+        return MarianMTModel.from_pretrained(model_dir, attn_implementation="sdpa", low_cpu_mem_usage=True)
+    except (TypeError, ValueError, ImportError):
+        return MarianMTModel.from_pretrained(model_dir, low_cpu_mem_usage=True)
+
+def clear_model_cache():
+    """Drop the cached checkpoints so the next load re-reads MODEL_DIR."""
+    _load_tokenizer.cache_clear()
+    _load_ckpt.cache_clear()
+
+def _int8_engine():
+    """First int8 GEMM backend PyTorch offers on this CPU (oneDNN uses VNNI/AMX), or None."""
+    engines = torch.backends.quantized.supported_engines
+    return next((engine for engine in ("onednn", "x86", "fbgemm") if engine in engines), None)
+
+def load_ct2_translator(root_window, status_label):
+    """
+    Convert the saved model to CTranslate2 once (int8 weights) and load it.
+    Returns None when ctranslate2 is not installed or conversion/loading fails.
+    """
+    if ctranslate2 is None:
+        return None
+    try:
+        if not os.path.isfile(os.path.join(CT2_DIR, "model.bin")):
+            root_window.after(0, lambda: status_label.config(text="Converting model to CTranslate2 (first run only)..."))
+            ctranslate2.converters.TransformersConverter(MODEL_DIR).convert(CT2_DIR, quantization="int8", force=True)
+        compute_type = "int8_float16" if device_str == "cuda" else "int8"
+        return ctranslate2.Translator(CT2_DIR, device=device_str, compute_type=compute_type)
+    except Exception:
+        return None
+
 def load_model_async(root_window, status_label, translate_button):
     """
     Load model in background thread. Downloads into MODEL_DIR if not present.
@@ -25,25 +95,52 @@ def load_model_async(root_window, status_label, translate_button):
     """
 
     def _load():
-        global translator
+        global model, tokenizer, ct2_translator, device_str, eager_forward
         try:
+            device_str = _get_device()
             # If local dir missing or empty, download from HF and save locally
             if not os.path.isdir(MODEL_DIR) or not os.listdir(MODEL_DIR):
                 root_window.after(0, lambda: status_label.config(text=f"Downloading model {MODEL_NAME} ..."))
-                model = MarianMTModel.from_pretrained(MODEL_NAME)
-                tokenizer = MarianTokenizer.from_pretrained(MODEL_NAME)
+                # locals only: the module-level model/tokenizer are set from MODEL_DIR below
+                downloaded_model = MarianMTModel.from_pretrained(MODEL_NAME)
+                downloaded_tokenizer = MarianTokenizer.from_pretrained(MODEL_NAME)
                 os.makedirs(MODEL_DIR, exist_ok=True)
-                model.save_pretrained(MODEL_DIR)
-                tokenizer.save_pretrained(MODEL_DIR)
+                # fp16 safetensors: half the bytes to read back, memory-mapped instead of unpickled
+                downloaded_model.half().save_pretrained(MODEL_DIR, safe_serialization=True)
+                downloaded_tokenizer.save_pretrained(MODEL_DIR)
+                del downloaded_model, downloaded_tokenizer
 
             # Load from local cache
             root_window.after(0, lambda: status_label.config(text="Loading tokenizer and model from cache..."))
-            tokenizer = MarianTokenizer.from_pretrained(MODEL_DIR)
-            model = MarianMTModel.from_pretrained(MODEL_DIR)
-            # move model to device (pipeline accepts device arg below)
-            model.to(device_str)
-            # build pipeline with device index (0 for cuda, -1 for cpu)
-            translator = pipeline("translation_en_to_ru", model=model, tokenizer=tokenizer, device=device_index)
+            tokenizer = _load_tokenizer(MODEL_DIR)
+            ct2_translator = load_ct2_translator(root_window, status_label)
+            if ct2_translator is None:
+                model = _load_ckpt(MODEL_DIR)
+                # move model to device
+                model.to(device_str)
+                if device_str == "cuda":
+                    # half precision on the GPU: bf16 on Ampere and newer, fp16 before that
+                    model.to(dtype=torch.bfloat16 if torch.cuda.get_device_capability()[0] >= 8 else torch.float16)
+                elif _int8_engine() is not None:
+                    # int8 weights for every Linear layer, activations quantized on the fly
+                    torch.backends.quantized.engine = _int8_engine()
+                    model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+                model.eval()
+                eager_forward = model.forward
+                try:
+                    if device_str == "cuda":
+                        # generate() calls forward() once per decoder step; CUDA graphs remove the per-step
+                        # launch overhead, dynamic=True keeps varying batch lengths from recompiling
+                        model.forward = torch.compile(eager_forward, mode="reduce-overhead", dynamic=True)
+                    # one short generate() so kernel selection and compilation happen now, not on the first click
+                    warmup = tokenizer(["warmup"], return_tensors="pt").to(device_str)
+                    with torch.inference_mode():
+                        model.generate(**warmup, max_new_tokens=8)
+                    if device_str != "cuda":
+                        eager_forward = None  # nothing compiled, nothing to fall back from
+                except Exception:
+                    model.forward = eager_forward  # torch without a working compiler: stay eager
+                    eager_forward = None
             root_window.after(0, lambda: status_label.config(text=f"Model loaded ({device_str}). Ready to translate."))
             root_window.after(0, lambda: translate_button.config(state="normal"))
         except Exception as ex:
@@ -54,37 +151,94 @@ def load_model_async(root_window, status_label, translate_button):
     threading.Thread(target=_load, daemon=True).start()
 
 # ------------- Translation logic -------------
-def translate_paragraphs(text, progress_var, progress_bar, status_label):
+def generate_batch(batch_ids):
+    """Pad one batch of token id lists, generate, and decode back to strings."""
+    global eager_forward
+    # translations are rarely much longer than their source, so short batches stop early
+    max_new_tokens = min(MAX_NEW_TOKENS, int(max(len(ids) for ids in batch_ids) * 1.5) + 10)
+    if ct2_translator is not None:
+        tokens = [tokenizer.convert_ids_to_tokens(ids) for ids in batch_ids]
+        results = ct2_translator.translate_batch(tokens, beam_size=BEAM_SIZE, max_decoding_length=max_new_tokens,
+                                                 no_repeat_ngram_size=3, max_batch_size=32)
+        return [tokenizer.convert_tokens_to_string(r.hypotheses[0]) for r in results]
+    batch = tokenizer.pad({"input_ids": batch_ids}, return_tensors="pt").to(device_str)
+    kwargs = dict(num_beams=BEAM_SIZE, max_new_tokens=max_new_tokens, early_stopping=True, no_repeat_ngram_size=3)
+    try:
+        with torch.inference_mode():
+            out = model.generate(**batch, **kwargs)
+    except Exception:
+        if eager_forward is None:
+            raise
+        # the compiled forward can still fail on shapes the warm-up never saw: go eager for good and retry once
+        model.forward, eager_forward = eager_forward, None
+        with torch.inference_mode():
+            out = model.generate(**batch, **kwargs)
+    # plain list of strings; SentencePiece output needs no extra space clean-up pass
+    return tokenizer.batch_decode(out, skip_special_tokens=True, clean_up_tokenization_spaces=False)
+
+def translate_paragraphs(text, root_window, progress_var, status_label):
     """
-    Translate paragraph-by-paragraph (split by double newline) and update progress.
+    Translate the non-empty paragraphs (split by double newline) in length-sorted batches and update progress.
     Returns combined translation string.
     """
-    if translator is None:
+    if tokenizer is None or (model is None and ct2_translator is None):
         raise RuntimeError("Translator is not loaded.")
 
     paragraphs = text.split("\n\n")
-    total = len(paragraphs) if paragraphs else 1
-    out_paragraphs = []
-
-    for idx, para in enumerate(paragraphs, start=1):
-        if para.strip():
-            # call pipeline; limit max_length to avoid runaway generation
-            try:
-                # translator returns list of dicts
-                result = translator(para, max_length=512)
-                translated = result[0]["translation_text"]
-            except Exception as e:
-                # if an error occurs for this paragraph, include error text and continue
-                translated = f"[ERROR translating paragraph: {e}]"
+    out_paragraphs = [""] * len(paragraphs)
+    last_update = 0.0
+
+    # every distinct paragraph is translated once; repeats within the text and
+    # paragraphs translated earlier in this session are filled in from the cache
+    pending = {}
+    for i, para in enumerate(paragraphs):
+        if not para.strip():
+            continue
+        if para in translation_cache:
+            out_paragraphs[i] = translation_cache[para]
         else:
-            translated = ""
-        out_paragraphs.append(translated)
-
-        # update progress
-        progress_value = int(idx / total * 100)
-        progress_var.set(progress_value)
-        progress_bar.update_idletasks()
-        status_label.config(text=f"Translating... {progress_value}%")
+            pending.setdefault(para, []).append(i)
+    batch_inputs = list(pending)
+    total = len(batch_inputs) if batch_inputs else 1
+    percents = [i * 100 // total for i in range(total + 1)]  # percent done after i paragraphs
+
+    # tokenize once, then batch paragraphs of similar length together so each
+    # generate() call only pads up to its own longest paragraph
+    input_ids = tokenizer(batch_inputs, truncation=True, max_length=512)["input_ids"] if batch_inputs else []
+    order = sorted(range(len(input_ids)), key=lambda k: len(input_ids[k]))
+
+    for start in range(0, len(order), BATCH_SIZE):
+        bucket = order[start:start + BATCH_SIZE]
+        failed = set()
+        try:
+            translated = generate_batch([input_ids[k] for k in bucket])
+        except Exception:
+            # retry this batch paragraph by paragraph so only the failing one is lost
+            translated = []
+            for k in bucket:
+                try:
+                    translated.extend(generate_batch([input_ids[k]]))
+                except Exception as e:
+                    translated.append(f"[ERROR translating paragraph: {e}]")
+                    failed.add(k)
+        for k, para_text in zip(bucket, translated):
+            para = batch_inputs[k]
+            for i in pending[para]:
+                out_paragraphs[i] = para_text
+            if k not in failed:
+                if len(translation_cache) >= TRANSLATION_CACHE_SIZE:
+                    translation_cache.pop(next(iter(translation_cache)))
+                translation_cache[para] = para_text
+
+        done = min(start + BATCH_SIZE, len(order))
+        # report progress at most 10 times a second, always on the Tk thread
+        now = time.monotonic()
+        if now - last_update >= 0.1 or done == len(order):
+            last_update = now
+            progress_value = percents[done]
+            root_window.after(0, lambda v=progress_value: (progress_var.set(v),
+                                                           status_label.config(text=f"Translating... {v}%")))
+
     return "\n\n".join(out_paragraphs)
 
 # ------------- GUI action handlers -------------
@@ -96,8 +250,14 @@ def on_open_docx(input_widget):
         doc = Document(fp)
         input_widget.delete("1.0", tk.END)
         # keep paragraphs separated by double newline
-        text = "\n\n".join([p.text for p in doc.paragraphs])
-        input_widget.insert("1.0", text)
+        text = "\n\n".join(p.text for p in doc.paragraphs)
+        if len(text) <= 1_000_000:
+            input_widget.insert("1.0", text)
+        else:
+            # huge documents go in piece by piece so the window keeps repainting
+            for i in range(0, len(text), INSERT_CHUNK):
+                input_widget.insert(tk.END, text[i:i + INSERT_CHUNK])
+                input_widget.update_idletasks()
     except Exception as e:
         messagebox.showerror("Open error", f"Failed to open .docx:\n\n{e}")
 
@@ -108,9 +268,10 @@ def on_save_docx(output_widget):
     try:
         doc = Document()
         full_text = output_widget.get("1.0", tk.END).rstrip()
-        if full_text:
-            for para in full_text.split("\n\n"):
-                doc.add_paragraph(para)
+        paragraphs = full_text.split("\n\n") if full_text else []
+        add_paragraph = doc.add_paragraph
+        for para in paragraphs:
+            add_paragraph(para)
         doc.save(fp)
         messagebox.showinfo("Saved", f"Saved to:\n{fp}")
     except Exception as e:
@@ -119,7 +280,7 @@ def on_save_docx(output_widget):
 def on_clear_input(input_widget):
     input_widget.delete("1.0", tk.END)
 
-def on_translate(input_widget, output_widget, progress_var, progress_bar, status_label):
+def on_translate(input_widget, output_widget, progress_var, status_label):
     text = input_widget.get("1.0", tk.END).strip()
     if not text:
         messagebox.showwarning("Empty input", "Please enter text to translate.")
@@ -134,7 +295,7 @@ def on_translate(input_widget, output_widget, progress_var, progress_bar, status
 
     def _task():
         try:
-            translated = translate_paragraphs(text, progress_var, progress_bar, status_label)
+            translated = translate_paragraphs(text, root, progress_var, status_label)
             # show result in GUI thread
             root.after(0, lambda: output_widget.insert("1.0", translated))
             root.after(0, lambda: status_label.config(text="Translation complete."))
@@ -176,7 +337,7 @@ btn_frame.pack(fill=tk.X, padx=28, pady=(0, 14))
 translate_btn = tk.Button(btn_frame, text="Translate", bg="#e43f5a", fg="white",
                           font=("Helvetica", 12, "bold"), padx=20, pady=8,
                           state="disabled",  # enabled after model loads
-                          command=lambda: on_translate(input_text, output_text, progress_var, progress_bar, status_label))
+                          command=lambda: on_translate(input_text, output_text, progress_var, status_label))
 translate_btn.pack(side="left", padx=8)
 
 clear_btn = tk.Button(btn_frame, text="Clear Input", bg="#0f3460", fg="white",
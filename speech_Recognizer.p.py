@@ -7,6 +7,7 @@ Gemini Live Voice — Final single-file streaming app
 import os
 import sys
 import math
+import array
 import time
 import json
 import threading
@@ -15,6 +16,8 @@ import colorsys
 import urllib.request
 import shutil
 import zipfile
+import importlib.util
+import tempfile
 import subprocess
 from collections import deque
 from datetime import datetime
@@ -81,6 +84,22 @@ def ensure_vosk_installed(status_callback=None):
             print("pip install exception:", e)
             return False
 
+# Optional: numba compiles the per-frame audio kernel below
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
+# Optional: orjson parses the Vosk results (and writes the settings file) faster than stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda o: orjson.dumps(o, option=orjson.OPT_INDENT_2)
+except Exception:
+    orjson = None
+    _loads = json.loads
+    _dumps = lambda o: json.dumps(o, indent=2).encode("utf-8")
+
 # ---------------------- CONFIG ----------------------
 CONFIG = {
     "app_title": "Gemini Live Voice — Streaming (final)",
@@ -98,6 +117,8 @@ CONFIG = {
     "sample_rate": 16000,       # VOSK small model prefers 16k
     "chunk_ms": 20,            # default frame size (you can tune down to 10)
     "partial_update_ms": 80,   # snappier partial updates
+    "queue_max_per_tick": 500, # messages handed to Tk per batch; the rest go in the next one
+    "transcript_max_lines": 5000,  # older lines are dropped from the log and the text box
     "settings_file": "gemini_stream_settings.json",
     "model_name": "vosk-model-small-en-us-0.15",
     "model_zip": "vosk-model-small-en-us-0.15.zip",
@@ -110,15 +131,44 @@ CANDIDATE_URLS = [
     "https://huggingface.co/ambind/vosk-model-small-en-us-0.15/resolve/main/vosk-model-small-en-us-0.15.zip",
 ]
 
+class SPSCRing:
+    # Single-producer / single-consumer ring for high-rate messages where only recent values
+    # matter. Only the producer writes head and only the consumer writes tail, and each store is
+    # atomic under the GIL, so neither side takes a lock. A producer that laps the consumer
+    # overwrites the oldest entries.
+    def __init__(self, capacity=64):
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._buf = [None]*size
+        self._mask = size - 1
+        self.head = 0
+        self.tail = 0
+
+    def put(self, item):
+        head = self.head
+        self._buf[head & self._mask] = item
+        self.head = head + 1
+
+    def drain(self):
+        head = self.head
+        tail = max(self.tail, head - len(self._buf))
+        items = [self._buf[i & self._mask] for i in range(tail, head)]
+        self.tail = head
+        return items
+
+# transcriptions and status lines: every message matters, so they keep the locking queue
 message_queue = queue.Queue()
 segment_queue = queue.Queue()
+# capture thread -> UI: one level per frame; Vosk thread -> UI: partial text ("" clears it)
+amplitude_ring = SPSCRing(64)
+partial_ring = SPSCRing(16)
 
 # ---------------------- Helpers ----------------------
-def _clamp01(x):
-    try:
-        return max(0.0, min(1.0, float(x)))
-    except Exception:
-        return 0.0
+def _transcription_msg(text):
+    # formatted here, on the recognizer thread, so the Tk thread only inserts the line
+    tstamp = datetime.now().strftime("%H:%M:%S")
+    return {"type":"transcription","text":text,"time":tstamp,"line":f"[{tstamp}] {text}"}
 
 def _clamp255(x):
     try:
@@ -126,65 +176,145 @@ def _clamp255(x):
     except Exception:
         return 0
 
+def _build_palette(bg_hex, hues=256, levels=16):
+    # palette[hue][level]: fully saturated hue blended over bg_hex at opacity level/(levels-1)
+    try:
+        h=bg_hex.lstrip("#"); br,bg,bb = tuple(int(h[i:i+2],16) for i in (0,2,4))
+    except Exception:
+        br,bg,bb = (0,0,0)
+    palette = []
+    for hue in range(hues):
+        r,g,b = (c*255 for c in colorsys.hsv_to_rgb(hue/hues,1.0,1.0))
+        row = []
+        for level in range(levels):
+            a = level/(levels-1)
+            row.append('#%02x%02x%02x' % (_clamp255(r*a + br*(1.0-a)), _clamp255(g*a + bg*(1.0-a)), _clamp255(b*a + bb*(1.0-a))))
+        palette.append(row)
+    return palette
+
 def load_settings():
     try:
         if os.path.exists(CONFIG["settings_file"]):
-            with open(CONFIG["settings_file"], "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(CONFIG["settings_file"], "rb") as f:
+                return _loads(f.read())
     except Exception:
         pass
     return {}
 
 def save_settings(d):
     try:
-        with open(CONFIG["settings_file"], "w", encoding="utf-8") as f:
-            json.dump(d, f, indent=2)
+        with open(CONFIG["settings_file"], "wb") as f:
+            f.write(_dumps(d))
     except Exception:
         pass
 
+# ---------------------- Frame analysis ----------------------
+def _frame_energy_zcr_np(arr):
+    # sum of squares and zero-crossing count of one int16 frame (NumPy fallback);
+    # np.dot would accumulate int16 * int16 in int16 and wrap, einsum accumulates in int64
+    ss = np.einsum("i,i->", arr, arr, dtype=np.int64)
+    return int(ss), int(np.count_nonzero(np.diff(np.signbit(arr))))
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def frame_energy_zcr(arr):
+        # one pass over the frame: sum of squares and sign changes
+        ss = 0
+        zc = 0
+        neg = arr[0] < 0
+        for i in range(arr.size):
+            v = np.int64(arr[i])
+            ss += v * v
+            now_neg = arr[i] < 0
+            if now_neg != neg:
+                zc += 1
+                neg = now_neg
+        return ss, zc
+    try:
+        # compile now (or load from the on-disk cache) instead of on the first mic frame;
+        # a read-only frame, like the np.frombuffer views _process_frame passes in
+        frame_energy_zcr(np.frombuffer(bytes(640), dtype=np.int16))
+    except Exception:
+        frame_energy_zcr = _frame_energy_zcr_np
+else:
+    frame_energy_zcr = _frame_energy_zcr_np
+
 # ---------------------- Download + extract ----------------------
-def _download_with_progress(url, dest_path, status_cb=None, chunk_size=8192, timeout=30):
+class _ProgressWriter:
+    # file wrapper for shutil.copyfileobj that reports every block it writes
+    def __init__(self, out, total, status_cb, label):
+        self.out = out
+        self.total = total
+        self.status_cb = status_cb
+        self.label = label
+        self.downloaded = 0
+
+    def write(self, b):
+        n = self.out.write(b)
+        self.downloaded += len(b)
+        if callable(self.status_cb):
+            try:
+                percent = int(self.downloaded*100/self.total) if self.total else None
+                self.status_cb(percent, self.downloaded, self.total, self.label)
+            except Exception:
+                pass
+        return n
+
+def _download_with_progress(url, dest, status_cb=None, chunk_size=128*1024, timeout=30, name=None):
+    # dest is a path (written via a .part file and renamed) or an open binary file
     try:
         req = urllib.request.Request(url, headers={"User-Agent":"Mozilla/5.0"})
         with urllib.request.urlopen(req, timeout=timeout) as resp:
             total = resp.getheader("Content-Length")
             total = int(total) if total and total.isdigit() else None
-            downloaded = 0
-            tmp_path = dest_path + ".part"
-            with open(tmp_path, "wb") as out:
-                while True:
-                    chunk = resp.read(chunk_size)
-                    if not chunk:
-                        break
-                    out.write(chunk)
-                    downloaded += len(chunk)
-                    if callable(status_cb):
-                        try:
-                            percent = int(downloaded*100/total) if total else None
-                            status_cb(percent, downloaded, total, f"Downloading {os.path.basename(dest_path)}")
-                        except Exception:
-                            pass
-            os.replace(tmp_path, dest_path)
+            label = f"Downloading {name or os.path.basename(str(dest))}"
+            if hasattr(dest, "write"):
+                writer = _ProgressWriter(dest, total, status_cb, label)
+                shutil.copyfileobj(resp, writer, length=chunk_size)
+            else:
+                tmp_path = dest + ".part"
+                with open(tmp_path, "wb") as out:
+                    writer = _ProgressWriter(out, total, status_cb, label)
+                    # 128 KiB reads: fewer recv() calls and progress updates than 8 KiB ones
+                    shutil.copyfileobj(resp, writer, length=chunk_size)
+                os.replace(tmp_path, dest)
             if callable(status_cb):
-                status_cb(100, downloaded, total, "Download complete")
+                status_cb(100, writer.downloaded, total, "Download complete")
             return True
     except Exception as e:
         if callable(status_cb):
             status_cb(None, 0, 0, f"Download error: {e}")
         return False
 
+def _extract_member(zf, info, root):
+    out_path = os.path.realpath(os.path.join(root, info.filename))
+    if os.path.commonpath([root, out_path]) != root:
+        raise ValueError(f"Unsafe path in archive: {info.filename}")
+    if info.is_dir():
+        os.makedirs(out_path, exist_ok=True)
+        return
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    # 1 MiB copies: far fewer read/inflate/write rounds than extract()'s defaults
+    with zf.open(info) as src, open(out_path, "wb", buffering=1<<20) as dst:
+        shutil.copyfileobj(src, dst, length=1<<20)
+
 def _extract_zip(zip_path, extract_to, status_cb=None):
+    # zip_path may be a path or an open file (auto_download_model passes its spooled download)
+    def report(i, total, name):
+        if callable(status_cb) and (i % 8 == 0 or i == total):
+            try:
+                status_cb(int(i*100/total), i, total, f"Extracting {name}")
+            except Exception:
+                pass
+
     try:
+        root = os.path.realpath(extract_to)
         with zipfile.ZipFile(zip_path, "r") as zf:
-            members = zf.namelist()
+            members = zf.infolist()
             total = len(members)
-            for i, name in enumerate(members, start=1):
-                zf.extract(name, path=extract_to)
-                if callable(status_cb):
-                    try:
-                        status_cb(int(i*100/total), i, total, f"Extracting {name}")
-                    except Exception:
-                        pass
+            for i, info in enumerate(members, start=1):
+                _extract_member(zf, info, root)
+                report(i, total, info.filename)
         return True
     except Exception as e:
         if callable(status_cb):
@@ -197,21 +327,19 @@ def auto_download_model(target_dir, urls, ui_status_callback):
         return True
     os.makedirs(os.path.dirname(target_dir), exist_ok=True)
     zipname = CONFIG["model_zip"]
-    zip_path = os.path.join(os.path.dirname(target_dir), zipname)
     for url in urls:
         ui_status_callback(None, 0, 0, f"Trying: {url}")
-        ok = _download_with_progress(url, zip_path, status_cb=ui_status_callback)
-        if not ok:
-            continue
-        ui_status_callback(None, 0, 0, "Extracting model...")
-        ok2 = _extract_zip(zip_path, os.path.dirname(target_dir), status_cb=ui_status_callback)
+        # the zip only lives long enough to be extracted: keep it in memory (spills to disk past 64 MB)
+        with tempfile.SpooledTemporaryFile(max_size=64<<20) as spool:
+            ok = _download_with_progress(url, spool, status_cb=ui_status_callback, name=zipname)
+            if not ok:
+                continue
+            ui_status_callback(None, 0, 0, "Extracting model...")
+            spool.seek(0)
+            ok2 = _extract_zip(spool, os.path.dirname(target_dir), status_cb=ui_status_callback)
         if ok2:
             possible = os.path.join(os.path.dirname(target_dir), CONFIG["model_name"])
             if os.path.isdir(possible):
-                try:
-                    os.remove(zip_path)
-                except Exception:
-                    pass
                 ui_status_callback(100, 0, 0, "Model ready")
                 if os.path.abspath(possible) != os.path.abspath(target_dir):
                     try:
@@ -228,10 +356,6 @@ def auto_download_model(target_dir, urls, ui_status_callback):
                     if nm.startswith("vosk-model") and os.path.isdir(p):
                         found = p; break
                 if found:
-                    try:
-                        os.remove(zip_path)
-                    except Exception:
-                        pass
                     ui_status_callback(100, 0, 0, f"Model ready ({os.path.basename(found)})")
                     if os.path.abspath(found) != os.path.abspath(target_dir):
                         try:
@@ -257,10 +381,22 @@ class GeminiVisualizer:
         self.smoothed = 0.0
         self.peak = 0.0
         self.wave_len = CONFIG["wave_len"]
-        self.wave = deque([0.0]*self.wave_len, maxlen=self.wave_len)
+        self._palette = _build_palette(self.bg)
+        # ring buffer of recent levels; wave_idx is the next slot to write (= the oldest sample)
+        self.wave = np.zeros(self.wave_len, np.float32)
+        self.wave_idx = 0
         self._create_items()
         self._running = False
-        self.particle_angles = [i*(2*math.pi/18.0) for i in range(18)]
+        self._dirty = True  # something changed since the last frame; idle frames are drawn at 10 fps
+        # per-particle / per-bar constants, so _loop only does a few whole-array operations
+        n = len(self.particles)
+        idx = np.arange(n)
+        self.particle_angles = (idx*(2*math.pi/n)).astype(np.float32)
+        self._part_speed = (0.6 + (idx % 4)*0.05).astype(np.float32)
+        self._part_rad_off = ((idx % 6)*18).astype(np.float32)
+        self._part_size_off = (2 + idx % 3).astype(np.float32)
+        self._part_op = (0.7*(0.8 - idx/n)).astype(np.float32)
+        self._bar_levels = ((np.arange(len(self.vu_bars)) + 1)/len(self.vu_bars)).astype(np.float32)
         self.start_time = time.time()
 
     def _safe_itemconfig(self, item, **kwargs):
@@ -302,24 +438,25 @@ class GeminiVisualizer:
         wave_right = int(w*0.92)
         wave_h = CONFIG["wave_height"]
         self.wave_area = (wave_left, wave_top, wave_right, wave_top+wave_h)
-        points=[]
-        for i in range(self.wave_len):
-            x = wave_left + (i/(self.wave_len-1))*(wave_right-wave_left)
-            y = wave_top + wave_h/2
-            points.append((x,y))
-        flat=[c for p in points for c in p]
+        # x positions never change between resizes; the loop only refills the y half of _wave_flat
+        self._wave_xs = np.linspace(wave_left, wave_right, self.wave_len, dtype=np.float32)
+        self._wave_flat = np.empty(self.wave_len*2, np.float32)
+        self._wave_flat[0::2] = self._wave_xs
+        self._wave_flat[1::2] = wave_top + wave_h/2
         try:
-            self.canvas.coords(self.wave_line, *flat)
+            self.canvas.coords(self.wave_line, *self._wave_flat.tolist())
             self._safe_itemconfig(self.wave_line, fill=self.accent)
         except Exception:
             pass
         bar_left_x = wave_left - 120
         bar_w, bar_gap = 16, 8
+        self._bar_xs = []  # (x1, x2) of each VU bar, so _loop never has to read coords back from Tk
         for i,bar in enumerate(self.vu_bars):
             bx1 = bar_left_x + (bar_w+bar_gap)*i
             by1 = wave_top + wave_h - 2
             bx2 = bx1 + bar_w
             by2 = by1 - 8
+            self._bar_xs.append((bx1, bx2))
             self.canvas.coords(bar, bx1, by1, bx2, by2)
             self._safe_itemconfig(bar, fill=self.accent)
 
@@ -327,10 +464,15 @@ class GeminiVisualizer:
         self.width=max(1,width); self.height=max(1,height)
         self.center=(self.width//2,int(self.height*0.44))
         self._place_static()
+        self._dirty = True
 
     def set_amplitude(self,a:float):
-        self.current_amp=float(np.clip(a,0.0,1.0))
-        self.wave.append(self.current_amp**0.9)
+        a=float(np.clip(a,0.0,1.0))
+        if abs(a - self.current_amp) > 0.005:
+            self._dirty = True
+        self.current_amp=a
+        self.wave[self.wave_idx] = self.current_amp**0.9
+        self.wave_idx = (self.wave_idx + 1) % self.wave_len
 
     def start(self):
         if not self._running:
@@ -339,6 +481,10 @@ class GeminiVisualizer:
     def stop(self):
         self._running=False
 
+    def wake(self):
+        # back to full frame rate on the next tick (new transcript/partial on screen)
+        self._dirty = True
+
     def _loop(self):
         if not self._running: return
         if self.current_amp > self.smoothed: alpha=0.45
@@ -346,69 +492,61 @@ class GeminiVisualizer:
         self.smoothed += (self.current_amp-self.smoothed)*alpha
         self.peak += (self.smoothed-self.peak)*0.12
         cx,cy=self.center
+        # every item update of this frame goes to Tcl as one script instead of ~80 separate calls
+        cv = self.canvas._w
+        cmds = []
+        def coords(item, x1, y1, x2, y2):
+            cmds.append(f"{cv} coords {item} {x1:.1f} {y1:.1f} {x2:.1f} {y2:.1f}")
         orb_base=36
         orb_r=orb_base + self.smoothed*110
-        self.canvas.coords(self.central_orb, cx-orb_r, cy-orb_r, cx+orb_r, cy+orb_r)
-        outline_op = _clamp01(self.peak*0.9)
-        outline_color = self._rainbow_hex(time.time()*0.16, outline_op)
-        self._safe_itemconfig(self.central_outline, outline=outline_color, width=2)
+        coords(self.central_orb, cx-orb_r, cy-orb_r, cx+orb_r, cy+orb_r)
+        # _rainbow_hex clamps opacity itself, so the loop passes raw values
+        outline_color = self._rainbow_hex(time.time()*0.16, self.peak*0.9)
+        cmds.append(f"{cv} itemconfigure {self.central_outline} -outline {outline_color} -width 2")
         base_r = 160 + self.smoothed*280
-        self.canvas.coords(self.base_ring, cx-base_r, cy-base_r, cx+base_r, cy+base_r)
+        coords(self.base_ring, cx-base_r, cy-base_r, cx+base_r, cy+base_r)
         phase=time.time()*0.14
         for i, ring in enumerate(self.glow_rings):
             radius = base_r + i*28
-            self.canvas.coords(ring, cx-radius, cy-radius, cx+radius, cy+radius)
+            coords(ring, cx-radius, cy-radius, cx+radius, cy+radius)
             op=(1.0 - i/(len(self.glow_rings)+1))*(0.85*self.smoothed+0.12)
-            self._safe_itemconfig(ring, outline=self._rainbow_hex(phase+i*0.08, _clamp01(op)))
+            cmds.append(f"{cv} itemconfigure {ring} -outline {self._rainbow_hex(phase+i*0.08, op)}")
         wave_left, wave_top, wave_right, wave_bottom = self.wave_area
         wave_h = wave_bottom - wave_top
-        pts=[]
-        n=len(self.wave)
-        for i,v in enumerate(self.wave):
-            x = wave_left + (i/(n-1))*(wave_right-wave_left)
-            y = wave_top + (wave_h/2) - (v*(wave_h*0.48))
-            pts.append((x,y))
-        flat=[c for p in pts for c in p]
-        try:
-            self.canvas.coords(self.wave_line, *flat)
-        except Exception:
-            pass
+        rolled = np.roll(self.wave, -self.wave_idx)  # oldest sample first
+        self._wave_flat[1::2] = (wave_top + wave_h/2) - rolled*(wave_h*0.48)
+        cmds.append(f"{cv} coords {self.wave_line} " + " ".join(map(str, np.round(self._wave_flat, 1).tolist())))
         intens=int(self.smoothed*len(self.vu_bars))
+        bar_tops = (wave_bottom - self._bar_levels*(wave_h*0.6*(0.6+self.smoothed*0.8))).tolist()
         for i,bar in enumerate(self.vu_bars):
-            try:
-                bx1,by1,bx2,by2 = self.canvas.coords(bar)
-            except Exception:
-                continue
-            full_h = wave_bottom - wave_top
-            level = (i+1)/len(self.vu_bars)
-            new_top = wave_bottom - (level*(full_h*0.6)*(0.6+self.smoothed*0.8))
-            self.canvas.coords(bar, bx1, new_top, bx2, wave_bottom-2)
+            bx1, bx2 = self._bar_xs[i]
+            coords(bar, bx1, bar_tops[i], bx2, wave_bottom-2)
             color_op = 0.9 if i<intens else 0.12
-            self._safe_itemconfig(bar, fill=self._rainbow_hex(phase+i*0.05, color_op))
+            cmds.append(f"{cv} itemconfigure {bar} -fill {self._rainbow_hex(phase+i*0.05, color_op)}")
         t=time.time()-self.start_time
+        angs = self.particle_angles + t*self._part_speed + self.smoothed*2.0
+        rads = self._part_rad_off + (orb_r*0.9 + self.smoothed*40)
+        xs = (cx + np.cos(angs)*rads).tolist()
+        ys = (cy + np.sin(angs)*(rads*0.6)).tolist()
+        sizes = (self._part_size_off + self.smoothed*5).tolist()
+        p_ops = (self._part_op*(0.8 + self.smoothed*0.4)).tolist()
         for i,p in enumerate(self.particles):
-            ang = self.particle_angles[i] + t*(0.6+(i%4)*0.05) + self.smoothed*2.0
-            rad = orb_r*0.9 + (i%6)*18 + self.smoothed*40
-            x = cx + math.cos(ang)*rad
-            y = cy + math.sin(ang)*(rad*0.6)
-            size = 2 + (i%3) + self.smoothed*5
-            self.canvas.coords(p, x-size, y-size, x+size, y+size)
-            p_op=(0.7*(0.8 - i/len(self.particles)))*(0.8 + self.smoothed*0.4)
-            self._safe_itemconfig(p, fill=self._rainbow_hex(phase+i*0.03, _clamp01(p_op)), outline=self._rainbow_hex(phase+i*0.03, _clamp01(p_op)), state="normal")
-        self.canvas.after(16, self._loop)
+            x, y, size = xs[i], ys[i], sizes[i]
+            coords(p, x-size, y-size, x+size, y+size)
+            p_color = self._rainbow_hex(phase+i*0.03, p_ops[i])
+            cmds.append(f"{cv} itemconfigure {p} -fill {p_color} -outline {p_color} -state normal")
+        try:
+            self.canvas.tk.eval("\n".join(cmds))
+        except tk.TclError:
+            pass
+        idle = not self._dirty and self.smoothed < 0.01 and self.peak < 0.01
+        self._dirty = False
+        self.canvas.after(100 if idle else 16, self._loop)
 
     def _rainbow_hex(self, phase, opacity):
-        opacity=_clamp01(opacity)
-        r,g,b = colorsys.hsv_to_rgb((phase%1.0),1.0,1.0)
-        r,g,b = int(round(r*255)), int(round(g*255)), int(round(b*255))
-        try:
-            h=CONFIG["bg"].lstrip("#"); br,bg,bb = tuple(int(h[i:i+2],16) for i in (0,2,4))
-        except Exception:
-            br,bg,bb = (0,0,0)
-        blend_r = _clamp255(r*opacity + br*(1.0-opacity))
-        blend_g = _clamp255(g*opacity + bg*(1.0-opacity))
-        blend_b = _clamp255(b*opacity + bb*(1.0-opacity))
-        return f'#{blend_r:02x}{blend_g:02x}{blend_b:02x}'
+        # 256 hue steps x 16 opacity steps, looked up instead of converted every call
+        level = int(opacity*15 + 0.5)
+        return self._palette[int(phase*256) & 255][15 if level > 15 else 0 if level < 0 else level]
 
 # ---------------------- Low-latency capture ----------------------
 class LowLatencyCapture:
@@ -425,6 +563,12 @@ class LowLatencyCapture:
         except Exception:
             self.pa = None
         self.sink = None
+        # simple VAD: silent frames only drive the visualizer, the recognizers never see them
+        self.noise_floor = 0.0
+        self.hangover_ms = 600          # keep feeding this long after speech so VOSK can end the utterance
+        self._voice_until = 0.0
+        self._preroll = deque(maxlen=5)  # last silent frames, sent ahead of speech onset
+        self.recent_rms = deque(maxlen=max(1, 1000 // max(1, chunk_ms)))  # ~1 s of levels, for _calibrate
 
     def list_input_devices(self):
         out=[]
@@ -448,9 +592,11 @@ class LowLatencyCapture:
         if self.running:
             return True
         try:
-            self.stream = self.pa.open(format=pyaudio.paInt16, channels=1, rate=self.rate, input=True, frames_per_buffer=self.chunk, input_device_index=self.device_index)
+            # callback mode: PortAudio's own thread hands us each frame, no Python read thread
+            self.stream = self.pa.open(format=pyaudio.paInt16, channels=1, rate=self.rate, input=True, frames_per_buffer=self.chunk,
+                                       input_device_index=self.device_index, stream_callback=self._pa_cb)
             self.running = True
-            threading.Thread(target=self._read_loop, daemon=True).start()
+            self.stream.start_stream()
             return True
         except Exception as e:
             message_queue.put({"type":"status","text":f"Mic start failed: {e}","color":CONFIG["error"]})
@@ -464,42 +610,92 @@ class LowLatencyCapture:
         except Exception:
             pass
 
-    def _read_loop(self):
-        while self.running:
-            try:
-                data = self.stream.read(self.chunk, exception_on_overflow=False)
-            except Exception:
-                message_queue.put({"type":"amplitude","value":0.0})
-                time.sleep(0.05); continue
-            arr = np.frombuffer(data, dtype=np.int16).astype(np.float32)
-            rms = 0.0
-            if arr.size>0:
-                rms = math.sqrt(float(np.mean(arr*arr))) / 32768.0
-            message_queue.put({"type":"amplitude","value":rms})
-            try:
+    def set_chunk_ms(self, chunk_ms):
+        # frames_per_buffer is fixed when a callback stream opens, so a new size needs a reopen
+        self.chunk_ms = chunk_ms
+        self.chunk = max(1, int(self.rate * chunk_ms / 1000))
+        self.recent_rms = deque(self.recent_rms, maxlen=max(1, 1000 // max(1, chunk_ms)))
+        if self.running:
+            self.stop()
+            return self.start()
+        return True
+
+    def _pa_cb(self, in_data, frame_count, time_info, status):
+        # called by PortAudio once per frames_per_buffer frame; must return quickly
+        if not self.running:
+            return (None, pyaudio.paComplete)
+        try:
+            self._process_frame(in_data)
+        except Exception:
+            pass
+        return (None, pyaudio.paContinue)
+
+    def _process_frame(self, data):
+        arr = np.frombuffer(data, dtype=np.int16)
+        rms = 0.0
+        voiced = False
+        if arr.size>0:
+            ss, zc = frame_energy_zcr(arr)
+            rms = math.sqrt(ss / arr.size) / 32768.0
+            voiced = self._is_voice(rms, zc, arr.size)
+        amplitude_ring.put(rms)
+        self.recent_rms.append(rms)
+        now = time.monotonic()
+        if voiced:
+            self._voice_until = now + self.hangover_ms / 1000.0
+        if voiced or now < self._voice_until:
+            frames = [*self._preroll, data]
+            self._preroll.clear()
+        else:
+            self._preroll.append(data)
+            frames = ()
+        try:
+            for frame in frames:
                 if callable(self.sink):
-                    self.sink(data)
+                    self.sink(frame)
                 else:
-                    segment_queue.put(data)
-            except Exception:
-                pass
-            time.sleep(self.chunk_ms / 1000.0 * 0.25)
+                    segment_queue.put(frame)
+        except Exception:
+            pass
+
+    def _is_voice(self, rms, zero_crossings, n):
+        # energy clearly above the running noise floor, and not broadband hiss (which crosses zero constantly)
+        voiced = rms > self.noise_floor * 3.0 + 0.003 and zero_crossings < n * 0.5
+        self.noise_floor += (rms - self.noise_floor) * (0.002 if voiced else 0.05)
+        return voiced
 
 # ---------------------- VOSK streaming wrapper ----------------------
+# Loaded vosk Models by absolute path. A Model is read-only once loaded and can back any number
+# of KaldiRecognizers, so reloading the same path (retry, "Load" clicked again) skips the disk read.
+_VOSK_MODEL_CACHE = {}
+_VOSK_MODEL_LOCK = threading.Lock()
+
+def _get_vosk_model(path):
+    from vosk import Model
+    key = os.path.abspath(path)
+    with _VOSK_MODEL_LOCK:
+        mdl = _VOSK_MODEL_CACHE.get(key)
+        if mdl is None:
+            mdl = Model(path)
+            _VOSK_MODEL_CACHE[key] = mdl
+        return mdl
+
 class VoskStreamer:
-    def __init__(self, model_path, sample_rate=CONFIG["sample_rate"], partial_interval_ms=CONFIG["partial_update_ms"]):
+    def __init__(self, model_path, sample_rate=CONFIG["sample_rate"], partial_interval_ms=CONFIG["partial_update_ms"], chunk_ms=CONFIG["chunk_ms"]):
         self.model_path = model_path
         self.sample_rate = sample_rate
         self.partial_interval_ms = partial_interval_ms
+        self.chunk_ms = chunk_ms
         self.model = None
         self.rec = None
-        self.queue = queue.Queue()
+        # ~1 s of 20 ms frames; if the decoder falls further behind the oldest audio is dropped
+        self.queue = queue.Queue(maxsize=50)
         self.running = False
         self._last_partial_time = 0.0
 
     def load(self):
         try:
-            from vosk import Model, KaldiRecognizer
+            from vosk import KaldiRecognizer
         except Exception as e:
             message_queue.put({"type":"status","text":f"VOSK import failed: {e}", "color": CONFIG["error"]})
             return False
@@ -508,7 +704,7 @@ class VoskStreamer:
             return False
         try:
             message_queue.put({"type":"status","text":"Loading VOSK model...","color":CONFIG["ready"]})
-            self.model = Model(self.model_path)
+            self.model = _get_vosk_model(self.model_path)
             self.rec = KaldiRecognizer(self.model, self.sample_rate)
             try:
                 self.rec.SetWords(False)
@@ -532,35 +728,57 @@ class VoskStreamer:
     def feed(self, bts: bytes):
         try:
             self.queue.put_nowait(bts)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(bts)
+            except queue.Full:
+                pass
         except Exception:
             pass
 
     def _loop(self):
-        import json as _json
         while self.running:
             try:
                 bts = self.queue.get(timeout=0.5)
             except queue.Empty:
                 continue
+            # Hand Kaldi whatever else is already waiting (up to one partial interval, at most 5 frames)
+            # in a single call; its per-call overhead does not depend on the chunk length.
+            max_extra = max(0, min(5, int(self.partial_interval_ms // max(1, self.chunk_ms))) - 1)
+            extras = []
+            while len(extras) < max_extra:
+                try:
+                    extras.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if extras:
+                bts = b"".join([bts, *extras])
             try:
                 if self.rec.AcceptWaveform(bts):
                     res = self.rec.Result()
+                    partial_ring.put("")  # the utterance is final, its partial is stale
                     try:
-                        j = _json.loads(res)
+                        j = _loads(res)
                         txt = j.get("text","").strip()
                         if txt:
-                            message_queue.put({"type":"transcription","text":txt,"time":datetime.now().strftime("%H:%M:%S")})
+                            message_queue.put(_transcription_msg(txt))
                     except Exception:
                         pass
                 else:
+                    now = time.time()*1000.0
+                    if (now - self._last_partial_time) < self.partial_interval_ms:
+                        continue  # too soon to show another partial: skip PartialResult() and its JSON
                     res = self.rec.PartialResult()
                     try:
-                        j = _json.loads(res)
+                        j = _loads(res)
                         p = j.get("partial","").strip()
-                        now = time.time()*1000.0
-                        if p and (now - self._last_partial_time) >= self.partial_interval_ms:
+                        if p:
                             self._last_partial_time = now
-                            message_queue.put({"type":"partial","text":p})
+                            partial_ring.put(p)
                     except Exception:
                         pass
             except Exception as e:
@@ -568,11 +786,12 @@ class VoskStreamer:
         # flush final
         try:
             if self.rec:
+                partial_ring.put("")
                 res = self.rec.FinalResult()
-                j = json.loads(res)
+                j = _loads(res)
                 txt = j.get("text","").strip()
                 if txt:
-                    message_queue.put({"type":"transcription","text":txt,"time":datetime.now().strftime("%H:%M:%S")})
+                    message_queue.put(_transcription_msg(txt))
         except Exception:
             pass
 
@@ -585,6 +804,9 @@ class GoogleSegmentWorker:
         self.sample_width=sample_width
         self.running=False
         self._thread=None
+        # capture only forwards speech (plus a short hangover), so a pause in frames ends an utterance
+        self.flush_gap_s=0.5
+        self.max_utterance_s=3.0
 
     def start(self):
         if self.running: return
@@ -595,18 +817,28 @@ class GoogleSegmentWorker:
         self.running=False
 
     def _loop(self):
+        # one recognize_google() request per utterance instead of per 20 ms frame
+        accum = bytearray()
+        last_frame = 0.0
+        max_bytes = int(self.max_utterance_s * self.sample_rate * self.sample_width)
         while self.running:
             try:
-                raw = segment_queue.get(timeout=0.5)
+                accum += segment_queue.get(timeout=0.1)
+                last_frame = time.monotonic()
+                if len(accum) < max_bytes:
+                    continue
             except queue.Empty:
-                continue
+                if not accum or time.monotonic() - last_frame < self.flush_gap_s:
+                    continue
+            raw = bytes(accum)
+            accum.clear()
             try:
                 audio = sr.AudioData(raw, self.sample_rate, self.sample_width)
                 try:
                     message_queue.put({"type":"status","text":"Recognizing...", "color":CONFIG["ready"]})
                     text = self.recognizer.recognize_google(audio)
                     if text.strip():
-                        self.queue.put({"type":"transcription","text":text,"time":datetime.now().strftime("%H:%M:%S")})
+                        self.queue.put(_transcription_msg(text))
                 except sr.UnknownValueError:
                     pass
                 except sr.RequestError:
@@ -626,17 +858,44 @@ class GeminiStreamingAutoDLApp:
         self.settings = load_settings()
         if isinstance(self.settings.get("accent"), str):
             CONFIG["accent"] = self.settings.get("accent")
+        self._refresh_sensitivity()
 
         # workers & modules
         self.capture = LowLatencyCapture(rate=CONFIG["sample_rate"], chunk_ms=self.settings.get("chunk_ms", CONFIG["chunk_ms"])) if PYAUDIO_AVAILABLE else None
         self.vosk_streamer = None
         self.google_worker = GoogleSegmentWorker(message_queue)
-        self.transcript_log=[]
+        # where captured speech frames go: the running VoskStreamer's feed, else the Google fallback.
+        # Swapped with a single attribute store, so the capture thread never checks the streamer state.
+        self._active_feed = segment_queue.put_nowait
+        if self.capture:
+            self.capture.sink = self._capture_sink
+        self.transcript_log = deque(maxlen=CONFIG["transcript_max_lines"])  # "[time] text" lines, formatted once
+        self._transcript_str_cache = None  # joined transcript for copy, rebuilt after new lines
+        # text box stays editable ("hot") while batches keep arriving, disabled 50 ms after the last one
+        self._textbox_hot = False
+        self._textbox_cool_pending = False
+        self._textbox_last_insert = 0.0
         self.partial_text = ""
+        self._idle_streak = 0  # consecutive _process_queue ticks that found nothing queued
+        self._chunk_apply_id = None  # pending after() that reopens the mic with a new frame size
+        # _process_queue writes levels here at its own (adaptive) rate; _render_tick hands the
+        # newest one to the visualizer at a steady ~30 fps, so the wave scrolls at a constant speed
+        self._amp_ring = array.array('f', [0.0]*64)
+        self._amp_head = 0
+        self._amp_rendered = 0
+        self._alive = True
         self._build_ui()
         self._start_queue_polling()
+        # started from inside mainloop: after_idle from another thread needs a running Tk loop
+        self.root.after(0, lambda: threading.Thread(target=self._pump_messages, daemon=True).start())
+        self.root.after(33, self._render_tick)
         self.visualizer.start()
-        threading.Thread(target=self._auto_model_and_start, daemon=True).start()
+        # one reused worker for model download/load: no thread per click, and two loads never overlap.
+        # A daemon thread rather than a ThreadPoolExecutor, whose workers are joined at exit and
+        # would keep the process alive until a running model download finished.
+        self._model_jobs = queue.Queue()
+        threading.Thread(target=self._model_worker, name="model-ops", daemon=True).start()
+        self._model_jobs.put((self._auto_model_and_start,))
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _build_ui(self):
@@ -695,9 +954,11 @@ class GeminiStreamingAutoDLApp:
         self.status_label = ctk.CTkLabel(bottom, text="Starting...", text_color=CONFIG["ready"], font=(CONFIG["font"],12))
         self.status_label.grid(row=0,column=0,sticky="w",padx=(4,8))
         self.partial_display = ctk.CTkLabel(bottom, text="", font=(CONFIG["font"],13), text_color="#FFD966")
-        self.partial_display.grid(row=0,column=1,sticky="w")
+        self.partial_display.grid(row=1,column=1,sticky="w",pady=(4,0))  # under the transcript, not hidden behind it
         self.text_box = ctk.CTkTextbox(bottom, height=160, wrap="word", font=(CONFIG["font"],13)); self.text_box.grid(row=0,column=1,sticky="ew",padx=(0,8))
         self.text_box.configure(state="disabled")
+        # bound once; _append_transcript_batch calls these for every batch
+        self._text_insert = self.text_box.insert; self._text_see = self.text_box.see; self._text_cfg = self.text_box.configure
         btn_frame = ctk.CTkFrame(bottom, fg_color="transparent"); btn_frame.grid(row=0,column=2,sticky="e")
         self.clear_btn = ctk.CTkButton(btn_frame, text="Clear", command=self.clear_transcript, width=100); self.clear_btn.grid(row=0,column=0,padx=6)
         self.copy_btn = ctk.CTkButton(btn_frame, text="Copy", command=self.copy_transcript, width=100); self.copy_btn.grid(row=0,column=1,padx=6)
@@ -708,30 +969,94 @@ class GeminiStreamingAutoDLApp:
         self.visualizer.on_resize(event.width, event.height)
 
     def _start_queue_polling(self):
-        self.root.after(32, self._process_queue)
+        self.root.after(16, self._process_queue)
+
+    def _pump_messages(self):
+        # Blocks on message_queue, so transcriptions and status lines reach Tk as soon as they
+        # are queued and nothing wakes up while it is empty. Whatever is already waiting goes
+        # along in the same batch (bounded, so a burst cannot stall Tk).
+        while self._alive:
+            batch = [message_queue.get()]
+            try:
+                while len(batch) < CONFIG["queue_max_per_tick"]:
+                    batch.append(message_queue.get_nowait())
+            except queue.Empty:
+                pass
+            if not self._alive:
+                break
+            try:
+                self.root.after_idle(self._apply_batch, batch)
+            except Exception:
+                break  # Tk is gone
+
+    def _apply_batch(self, batch):
+        # Tk thread: all new transcriptions in one insert, and only the newest status line.
+        status = None
+        transcripts = []
+        for msg in batch:
+            if msg is None:
+                continue  # shutdown wake-up from _on_close
+            tp = msg.get("type")
+            if tp == "transcription":
+                transcripts.append(msg["line"])
+            elif tp == "status":
+                status = (msg.get("text",""), msg.get("color", CONFIG["ready"]))
+        try:
+            if transcripts:
+                self._append_transcript_batch(transcripts)
+                self.visualizer.wake()
+            if status is not None:
+                self._set_status(*status)
+        except tk.TclError:
+            pass  # window is being torn down
 
     def _process_queue(self):
+        # The lock-free rings have no wake-up, so they are polled: of everything pushed since
+        # the last tick only the newest amplitude and partial are drawn.
+        handled = 0
         try:
-            while not message_queue.empty():
-                msg = message_queue.get_nowait()
-                tp = msg.get("type")
-                if tp == "amplitude":
-                    amp = float(msg.get("value",0.0)) * (self.settings.get("sensitivity",1.0) if isinstance(self.settings.get("sensitivity"), (int,float)) else 1.0)
-                    amp = max(0.0, min(1.0, amp))
-                    self.visualizer.set_amplitude(amp)
-                elif tp == "transcription":
-                    txt = msg.get("text","")
-                    tstamp = msg.get("time", datetime.now().strftime("%H:%M:%S"))
-                    self._append_transcript(tstamp, txt)
-                    self.partial_display.configure(text="")
-                elif tp == "partial":
-                    p = msg.get("text","")
-                    self.partial_display.configure(text=f"▸ {p}")
-                elif tp == "status":
-                    self._set_status(msg.get("text",""), msg.get("color", CONFIG["ready"]))
-        except Exception:
-            pass
-        self.root.after(32, self._process_queue)
+            amp = None
+            partial = None
+            amps = amplitude_ring.drain()
+            if amps:
+                amp = amps[-1]
+            partials = partial_ring.drain()
+            if partials:
+                partial = partials[-1]
+            handled = len(amps) + len(partials)
+            if partial is not None:
+                self.partial_display.configure(text=f"▸ {partial}" if partial else "")
+                self.visualizer.wake()
+            if amp is not None:
+                amp = amp * self._sensitivity
+                if amp < 0.0: amp = 0.0
+                elif amp > 1.0: amp = 1.0
+                self._amp_ring[self._amp_head & 63] = amp
+                self._amp_head += 1
+        except tk.TclError:
+            pass  # window is being torn down
+        finally:
+            # re-armed even if something above raised (Tk still reports it), so polling never stops;
+            # poll again soon while levels are flowing, back off towards 100 ms while idle
+            if handled:
+                self._idle_streak = 0
+                delay = 8
+            else:
+                self._idle_streak += 1
+                delay = min(self._idle_streak*8, 100)
+            self.root.after(delay, self._process_queue)
+
+    def _render_tick(self):
+        head = self._amp_head
+        if head != self._amp_rendered:
+            self.visualizer.set_amplitude(self._amp_ring[(head - 1) & 63])
+            self._amp_rendered = head
+        self.root.after(33, self._render_tick)
+
+    def _refresh_sensitivity(self):
+        # read once per settings change rather than on every amplitude update
+        sens = self.settings.get("sensitivity")
+        self._sensitivity = float(sens) if isinstance(sens, (int,float)) else 1.0
 
     def _set_status(self, txt, color):
         try:
@@ -739,13 +1064,42 @@ class GeminiStreamingAutoDLApp:
         except Exception:
             pass
 
-    def _append_transcript(self, tstamp, text):
-        self.text_box.configure(state="normal")
-        entry = f"[{tstamp}] {text}\n"
-        self.text_box.insert(tk.END, entry)
-        self.text_box.see(tk.END)
-        self.text_box.configure(state="disabled")
-        self.transcript_log.append((tstamp, text))
+    def _append_transcript_batch(self, lines):
+        # one insert and scroll per batch; the state toggle is paid once per burst of batches
+        if not self._textbox_hot:
+            self._text_cfg(state="normal")
+            self._textbox_hot = True
+        self._text_insert(tk.END, "\n".join(lines) + "\n")
+        excess = int(self.text_box.index("end-1c").split(".")[0]) - 1 - CONFIG["transcript_max_lines"]
+        if excess > 0:
+            self.text_box.delete("1.0", f"{excess+1}.0")
+        self._text_see(tk.END)
+        self._textbox_last_insert = time.monotonic()
+        if not self._textbox_cool_pending:
+            self._textbox_cool_pending = True
+            self.root.after(50, self._cool_textbox)
+        self.transcript_log.extend(lines)
+        self._transcript_str_cache = None
+
+    def _cool_textbox(self):
+        wait_ms = int(50 - (time.monotonic() - self._textbox_last_insert)*1000)
+        if wait_ms > 0:
+            self.root.after(wait_ms, self._cool_textbox)  # more arrived, stay hot a little longer
+            return
+        self._textbox_cool_pending = False
+        if self._textbox_hot:
+            self._text_cfg(state="disabled")
+            self._textbox_hot = False
+
+    def _model_worker(self):
+        while True:
+            job = self._model_jobs.get()
+            if job is None:
+                return
+            try:
+                job[0](*job[1:])
+            except Exception as e:
+                message_queue.put({"type":"status","text":f"Model error: {e}","color":CONFIG["error"]})
 
     def _auto_model_and_start(self):
         # start google fallback worker
@@ -761,9 +1115,8 @@ class GeminiStreamingAutoDLApp:
                     pass
             # apply saved chunk
             cfg_chunk = self.settings.get("chunk_ms")
-            if isinstance(cfg_chunk, int):
-                self.capture.chunk_ms = cfg_chunk
-                self.capture.chunk = max(1, int(self.capture.rate * cfg_chunk / 1000))
+            if isinstance(cfg_chunk, int) and cfg_chunk != self.capture.chunk_ms:
+                self.capture.set_chunk_ms(cfg_chunk)
             self.capture.start()
 
         # Attempt to import vosk
@@ -779,7 +1132,7 @@ class GeminiStreamingAutoDLApp:
 
         target_dir = self.settings.get("vosk_model_path") or CONFIG["model_target_dir"]
         if os.path.isdir(target_dir):
-            self._load_vosk_model(target_dir)
+            self._load_vosk_model_sync(target_dir)  # already on the model-ops worker
             return
 
         parent = os.path.dirname(CONFIG["model_target_dir"]) or "."
@@ -793,7 +1146,7 @@ class GeminiStreamingAutoDLApp:
         if ok:
             self.settings["vosk_model_path"] = CONFIG["model_target_dir"]
             save_settings(self.settings)
-            self._load_vosk_model(CONFIG["model_target_dir"])
+            self._load_vosk_model_sync(CONFIG["model_target_dir"])
         else:
             message_queue.put({"type":"status","text":"Auto-download failed — running fallback", "color": CONFIG["error"]})
 
@@ -802,41 +1155,38 @@ class GeminiStreamingAutoDLApp:
         if path:
             if not os.path.isdir(path):
                 self._set_status("Provided path not found, attempting to auto-download...", CONFIG["error"])
-                threading.Thread(target=self._auto_model_and_start, daemon=True).start()
+                self._model_jobs.put((self._auto_model_and_start,))
                 return
             else:
                 self._load_vosk_model(path)
                 return
         self._set_status("No model path given — auto-downloading small model...", CONFIG["ready"])
-        threading.Thread(target=self._auto_model_and_start, daemon=True).start()
+        self._model_jobs.put((self._auto_model_and_start,))
 
     def _load_vosk_model(self, path):
-        def _load():
-            try:
-                message_queue.put({"type":"status","text":"Loading model...", "color": CONFIG["ready"]})
-                vs = VoskStreamer(path, sample_rate=CONFIG["sample_rate"], partial_interval_ms=self.partial_var.get())
-                ok = vs.load()
-                if ok:
-                    if self.vosk_streamer:
-                        self.vosk_streamer.stop()
-                    self.vosk_streamer = vs
-                    self.vosk_streamer.start()
-                    message_queue.put({"type":"status","text":"VOSK loaded & streaming", "color": CONFIG["ready"]})
-                else:
-                    message_queue.put({"type":"status","text":"VOSK load failed", "color": CONFIG["error"]})
-            except Exception as e:
-                message_queue.put({"type":"status","text":f"VOSK load error: {e}", "color": CONFIG["error"]})
-        threading.Thread(target=_load, daemon=True).start()
+        self._model_jobs.put((self._load_vosk_model_sync, path))
 
-    def _capture_sink(self, data_bytes):
+    def _load_vosk_model_sync(self, path):
         try:
-            if self.vosk_streamer and self.vosk_streamer.running:
-                self.vosk_streamer.feed(data_bytes)
+            message_queue.put({"type":"status","text":"Loading model...", "color": CONFIG["ready"]})
+            chunk_ms = self.capture.chunk_ms if self.capture else CONFIG["chunk_ms"]
+            vs = VoskStreamer(path, sample_rate=CONFIG["sample_rate"], partial_interval_ms=self.partial_var.get(), chunk_ms=chunk_ms)
+            ok = vs.load()
+            if ok:
+                if self.vosk_streamer:
+                    self.vosk_streamer.stop()
+                self.vosk_streamer = vs
+                self.vosk_streamer.start()
+                self._active_feed = vs.feed
+                message_queue.put({"type":"status","text":"VOSK loaded & streaming", "color": CONFIG["ready"]})
             else:
-                try:
-                    segment_queue.put_nowait(data_bytes)
-                except Exception:
-                    pass
+                message_queue.put({"type":"status","text":"VOSK load failed", "color": CONFIG["error"]})
+        except Exception as e:
+            message_queue.put({"type":"status","text":f"VOSK load error: {e}", "color": CONFIG["error"]})
+
+    def _capture_sink(self, data_bytes):
+        try:
+            self._active_feed(data_bytes)
         except Exception:
             pass
 
@@ -847,6 +1197,7 @@ class GeminiStreamingAutoDLApp:
             if self.vosk_streamer:
                 self.vosk_streamer.partial_interval_ms = v
             self.settings["partial_update_ms"] = v
+            self._refresh_sensitivity()
         except Exception:
             pass
 
@@ -854,30 +1205,51 @@ class GeminiStreamingAutoDLApp:
         try:
             v = int(float(val))
             self.chunk_label.configure(text=f"Frame(ms): {v}")
-            if self.capture:
-                self.capture.chunk_ms = v
-                self.capture.chunk = max(1, int(self.capture.rate * v / 1000))
             self.settings["chunk_ms"] = v
+            # the mic stream is reopened for the new size once the slider settles, not on every step
+            if self._chunk_apply_id is not None:
+                self.root.after_cancel(self._chunk_apply_id)
+            self._chunk_apply_id = self.root.after(300, self._apply_chunk_ms, v)
         except Exception:
             pass
 
+    def _apply_chunk_ms(self, v):
+        self._chunk_apply_id = None
+        if self.capture:
+            self.capture.set_chunk_ms(v)
+        if self.vosk_streamer:
+            self.vosk_streamer.chunk_ms = v  # frames now arriving really are v ms long
+
     def _calibrate(self):
+        recognizer = self.google_worker.recognizer
+        # the capture stream already has the last second of input: measure that instead of
+        # opening a second PortAudio stream on the same device
+        if self.capture and self.capture.running and self.capture.recent_rms:
+            levels = list(self.capture.recent_rms)
+            ambient = sum(levels) / len(levels)
+            self.capture.noise_floor = ambient
+            recognizer.energy_threshold = ambient * 32768.0 * recognizer.dynamic_energy_ratio
+            self._set_status("Calibrated", CONFIG["ready"])
+            return
         try:
             mic = sr.Microphone()
             with mic as source:
-                r = sr.Recognizer()
-                r.adjust_for_ambient_noise(source, duration=1.0)
+                recognizer.adjust_for_ambient_noise(source, duration=1.0)
                 self._set_status("Calibrated", CONFIG["ready"])
         except Exception as e:
             self._set_status(f"Calibrate error: {e}", CONFIG["error"])
 
     def clear_transcript(self):
-        self.text_box.configure(state="normal"); self.text_box.delete("1.0", tk.END); self.text_box.configure(state="disabled"); self.transcript_log=[]
+        self.text_box.configure(state="normal"); self.text_box.delete("1.0", tk.END); self.text_box.configure(state="disabled")
+        self._textbox_hot = False
+        self.transcript_log.clear(); self._transcript_str_cache = None
         self._set_status("Cleared transcript", CONFIG["ready"])
 
     def copy_transcript(self):
         try:
-            self.root.clipboard_clear(); self.root.clipboard_append("\n".join(f"[{t}] {s}" for t,s in self.transcript_log))
+            if self._transcript_str_cache is None:
+                self._transcript_str_cache = "\n".join(self.transcript_log)
+            self.root.clipboard_clear(); self.root.clipboard_append(self._transcript_str_cache)
             self._set_status("Copied to clipboard", CONFIG["ready"])
         except Exception:
             self._set_status("Copy failed", CONFIG["error"])
@@ -886,23 +1258,38 @@ class GeminiStreamingAutoDLApp:
         if not self.transcript_log:
             self._set_status("No transcript to export", CONFIG["error"]); return
         now = datetime.now().strftime("%Y%m%d_%H%M%S"); fname=f"transcript_{now}.txt"
-        try:
-            with open(fname,"w",encoding="utf-8") as f:
-                for t,s in self.transcript_log: f.write(f"[{t}] {s}\n")
-            self._set_status(f"Exported {fname}", CONFIG["ready"])
-        except Exception as e:
-            self._set_status(f"Export failed: {e}", CONFIG["error"])
+        if self._transcript_str_cache is None:
+            self._transcript_str_cache = "\n".join(self.transcript_log)
+        payload = (self._transcript_str_cache + "\n").encode("utf-8")
+        def _write():
+            # off the Tk thread; the result comes back as a status message
+            try:
+                fd = os.open(fname, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+                try:
+                    view = memoryview(payload)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                message_queue.put({"type":"status","text":f"Exported {fname}","color":CONFIG["ready"]})
+            except Exception as e:
+                message_queue.put({"type":"status","text":f"Export failed: {e}","color":CONFIG["error"]})
+        threading.Thread(target=_write, daemon=True).start()
 
     def _save_settings(self):
         self.settings["chunk_ms"] = int(self.chunk_ms_var.get()); self.settings["partial_update_ms"] = int(self.partial_var.get())
-        save_settings(self.settings); self._set_status("Settings saved", CONFIG["ready"])
+        save_settings(self.settings); self._refresh_sensitivity(); self._set_status("Settings saved", CONFIG["ready"])
 
     def _on_close(self):
+        self._alive = False
+        message_queue.put(None)  # wake _pump_messages so it can exit
         try:
             if self.capture: self.capture.stop()
+            self._active_feed = segment_queue.put_nowait
             if self.vosk_streamer: self.vosk_streamer.stop()
             self.google_worker.stop()
             self.visualizer.stop()
+            self._model_jobs.put(None)
         except Exception:
             pass
         self.root.after(120, self.root.destroy)
@@ -918,14 +1305,13 @@ def main():
         except Exception:
             pass
 
-    # Attempt to ensure vosk is installed (non-blocking UI will still start)
-    threading.Thread(target=lambda: ensure_vosk_installed(status_callback=console_cb), daemon=True).start()
-
-    try:
-        import vosk  # noqa: F401
-        VOSK_AVAILABLE = True
-    except Exception:
+    # find_spec only looks the package up, it does not import it (or its native library);
+    # the pip bootstrap thread is only started when vosk is really missing (non-blocking UI will still start)
+    if importlib.util.find_spec("vosk") is None:
+        threading.Thread(target=lambda: ensure_vosk_installed(status_callback=console_cb), daemon=True).start()
         VOSK_AVAILABLE = False
+    else:
+        VOSK_AVAILABLE = True
 
     print("PyAudio available:", PYAUDIO_AVAILABLE, "VOSK available:", VOSK_AVAILABLE)
     try: